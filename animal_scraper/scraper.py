@@ -1,5 +1,5 @@
 from typing import List, Dict, Tuple, Any
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
 from .form_parser import AnimalFormParser
 from ranch_scraper.utils import clean_table_data, format_table_output
 
@@ -70,18 +70,12 @@ class AnimalSearchScraper:
 
     async def _wait_for_results(self, page: Page) -> bool:
         try:
-            # Wait until results container appears and has rows
-            for _ in range(60):
-                has_container = await page.evaluate("""
-                    () => !!document.querySelector('#dvSearchResults')
-                """)
-                if has_container:
-                    has_rows = await page.evaluate("""
-                        () => document.querySelectorAll('#dvSearchResults tr[id^="tr_"]').length > 0
-                    """)
-                    if has_rows:
-                        return True
-                await page.wait_for_timeout(500)
+            # Wait until results container appears and has rows, polled in the page
+            await page.wait_for_function("""
+                () => document.querySelectorAll('#dvSearchResults tr[id^="tr_"]').length > 0
+            """, timeout=30000, polling=250)
+            return True
+        except PlaywrightTimeoutError:
             return False
         except Exception as e:
             print(f'Error waiting for Animal results: {e}')
@@ -167,29 +161,29 @@ class AnimalSearchScraper:
                     if (!mainTable) return details;
                     
                     // Extract basic identification info from the main table
+                    const LABELS = new Map([
+                        ['Sex:', 'sex'],
+                        ['Name:', 'name'],
+                        ['Registration:', 'registration'],
+                        ['International ID:', 'international_id'],
+                        ['EID:', 'eid'],
+                        ['Horn/Poll/Scur:', 'horn_poll_scur'],
+                        ['Shorthorn %:', 'shorthorn_percent'],
+                        ['COI:', 'coi'],
+                        ['Service Type:', 'service_type'],
+                        ['Status:', 'status'],
+                        ['Color:', 'color'],
+                        ['DOB:', 'dob'],
+                        ['Disposal:', 'disposal'],
+                    ]);
                     const rows = mainTable.querySelectorAll('tr');
                     for (const row of rows) {
                         const cells = row.querySelectorAll('td');
-                        if (cells.length >= 2) {
-                            const label = cells[0]?.textContent?.trim();
-                            const value = cells[1]?.textContent?.trim();
-                            
-                            if (label && value && !label.includes('Identification') && !label.includes('Other Details')) {
-                                if (label.includes('Sex:')) details.sex = value;
-                                if (label.includes('Name:')) details.name = value;
-                                if (label.includes('Registration:')) details.registration = value.replace('*x', '').trim();
-                                if (label.includes('International ID:')) details.international_id = value;
-                                if (label.includes('EID:')) details.eid = value;
-                                if (label.includes('Horn/Poll/Scur:')) details.horn_poll_scur = value;
-                                if (label.includes('Shorthorn %:')) details.shorthorn_percent = value;
-                                if (label.includes('COI:')) details.coi = value;
-                                if (label.includes('Service Type:')) details.service_type = value;
-                                if (label.includes('Status:')) details.status = value;
-                                if (label.includes('Color:')) details.color = value;
-                                if (label.includes('DOB:')) details.dob = value;
-                                if (label.includes('Disposal:')) details.disposal = value;
-                            }
-                        }
+                        if (cells.length < 2) continue;
+                        const field = LABELS.get(cells[0].textContent.trim());
+                        if (!field) continue;
+                        const value = cells[1].textContent.trim();
+                        if (value) details[field] = field === 'registration' ? value.replace('*x', '').trim() : value;
                     }
                     
                     // Extract Sire and Dam info from the main table
@@ -2,6 +2,7 @@ import asyncio
 from typing import Dict, List, Optional, Set
 from playwright.async_api import Page
 from .scraper import EPDSearchScraper
+from ranch_scraper.browser import block_resources
 from ranch_scraper.exporter import DynamicExporter
 
 # semantic imports
@@ -189,20 +190,23 @@ class EPDSearchCLI:
                     print(summarize_epd_results(results))
             except Exception:
                 pass
-            await self._show_follow_up_menu(page, results)
+            await self._show_follow_up_menu(page, results, params)
         except Exception as e:
             print(f'Error in EPD scraper: {e}')
+        finally:
+            await self.scraper.close()
 
-    async def _show_follow_up_menu(self, page: Page, data: List[Dict[str, str]]):
+    async def _show_follow_up_menu(self, page: Page, data: List[Dict[str, str]], params: Dict[str, str]):
         while True:
             print('\nWhat would you like to do next?')
             print('1. Export results to CSV')
             print('2. Export results to JSON')
             print('3. View animal details')
             print('4. New search')
-            print('5. Return to main menu')
+            print('5. Refresh results (skip cache)')
+            print('6. Return to main menu')
             try:
-                choice = input('\nEnter your choice (1-5): ').strip()
+                choice = input('\nEnter your choice (1-6): ').strip()
                 if choice == '1':
                     filename = input("Enter CSV filename (or press Enter for 'epd_results.csv'): ").strip()
                     if not filename:
@@ -227,21 +231,33 @@ class EPDSearchCLI:
                     if not await self.scraper.wait_for_epd_form_ready(page):
                         print('Failed to load EPD search form')
                         continue
-                    params = await self.collect_epd_parameters(page)
-                    if not params:
+                    new_params = await self.collect_epd_parameters(page)
+                    if not new_params:
                         print('No search parameters provided.')
                         continue
-                    new_results = await self.scraper.scrape_epd(params)
+                    new_results = await self.scraper.scrape_epd(new_params)
                     if not new_results:
                         print('No EPD results found')
                         continue
                     data = new_results
+                    params = new_params
                     print('\n' + self.scraper.format_results_table(data))
                 elif choice == '5':
+                    # Same search, but fetched from the site instead of the results cache
+                    if not await self.scraper.wait_for_epd_form_ready(page):
+                        print('Failed to load EPD search form')
+                        continue
+                    new_results = await self.scraper.scrape_epd(params, force_refresh=True)
+                    if not new_results:
+                        print('No EPD results found')
+                        continue
+                    data = new_results
+                    print('\n' + self.scraper.format_results_table(data))
+                elif choice == '6':
                     print('Returning to main menu...')
                     break
                 else:
-                    print('Invalid choice. Please enter 1, 2, 3, 4, or 5.')
+                    print('Invalid choice. Please enter 1, 2, 3, 4, 5, or 6.')
             except KeyboardInterrupt:
                 print('\nOperation cancelled.')
                 break
@@ -279,9 +295,11 @@ class EPDSearchCLI:
                     print('No detail URL available for this animal.')
                     return data
                 print(f"\nFetching details for {selected_animal.get('registration', 'Unknown')}...")
+                detail_page = None
                 try:
-                    self.scraper.browser, self.scraper.playwright = await self.scraper.init_browser()
-                    detail_page = await self.scraper.browser.new_page()
+                    browser, _ = await self.scraper.init_browser()
+                    detail_page = await browser.new_page()
+                    await block_resources(detail_page)
                     details = await self.scraper.extract_animal_detail(detail_page, registration_url)
                     if details:
                         formatted_details = self.scraper.format_animal_detail(details)
@@ -298,14 +316,9 @@ class EPDSearchCLI:
                     print(f'Error viewing animal details: {e}')
                     return data
                 finally:
-                    if self.scraper.browser:
-                        try:
-                            await self.scraper.browser.close()
-                        except Exception:
-                            pass
-                    if self.scraper.playwright:
+                    if detail_page:
                         try:
-                            await self.scraper.playwright.stop()
+                            await detail_page.close()
                         except Exception:
                             pass
             else:
@@ -321,25 +334,18 @@ class EPDSearchCLI:
     async def _view_all_animal_details(self, page: Page, data: List[Dict[str, str]]):
         print(f'\nFetching details for all {len(data)} animals...')
         try:
-            self.scraper.browser, self.scraper.playwright = await self.scraper.init_browser()
-            detail_page = await self.scraper.browser.new_page()
+            urls = [animal['registration_url'] for animal in data if animal.get('registration_url')]
+            details_by_url = dict(zip(urls, await self.scraper.extract_animal_details_many(urls)))
             all_details = []
-            for i, animal in enumerate(data, 1):
+            for animal in data:
                 registration_url = animal.get('registration_url')
                 if not registration_url:
                     print(f"Skipping {animal.get('registration', 'Unknown')} - no URL available")
                     all_details.append(animal)
                     continue
-                print(f"Processing {i}/{len(data)}: {animal.get('registration', 'Unknown')}")
-                try:
-                    details = await self.scraper.extract_animal_detail(detail_page, registration_url)
-                    merged_data = animal.copy()
-                    merged_data.update(details)
-                    all_details.append(merged_data)
-                except Exception as e:
-                    print(f"Error processing {animal.get('registration', 'Unknown')}: {e}")
-                    all_details.append(animal)
-                    continue
+                merged_data = animal.copy()
+                merged_data.update(details_by_url[registration_url])
+                all_details.append(merged_data)
             print('\nExtraction complete.')
             print('\n' + self.scraper.format_results_table(all_details))
             await self._show_export_menu(all_details)
@@ -347,17 +353,6 @@ class EPDSearchCLI:
         except Exception as e:
             print(f'Error viewing all animal details: {e}')
             return data
-        finally:
-            if self.scraper.browser:
-                try:
-                    await self.scraper.browser.close()
-                except Exception:
-                    pass
-            if self.scraper.playwright:
-                try:
-                    await self.scraper.playwright.stop()
-                except Exception:
-                    pass
 
     async def _show_export_menu(self, data: List[Dict[str, str]]):
         while True:
@@ -1,38 +1,276 @@
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
-from playwright.async_api import async_playwright, Browser, Page
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeoutError
 from .form_parser import EPDFormParser
-from ranch_scraper.utils import clean_table_data, format_table_output
+from ranch_scraper.browser import BrowserManager, PagePool, block_resources
+from ranch_scraper.utils import format_table_output, read_json_cache, write_json_cache
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+EPD_TRAITS = ('CED', 'BW', 'WW', 'YW', 'MK', 'TM', 'CEM', 'ST', 'YG', 'CW', 'REA', 'FAT', 'MB', '$CEZ', '$BMI', '$CPI', '$F')
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'epd_scraper')
+DEFAULT_CACHE_TTL = 6 * 60 * 60
+MAX_CACHE_ENTRIES = 256
+
+_EXTRACT_TABLE_JS = """
+    () => {
+        const traits = window.__EPD_TRAITS;
+        if (!traits) return null;
+        const traitCount = traits.length;
+        const keys = ['registration', 'registration_url', 'tattoo', 'name'];
+        for (const t of traits) keys.push(`${t}_epd`, `${t}_change`, `${t}_acc`, `${t}_rank`);
+        // One column per key; null marks a value missing from that row
+        const cols = Object.fromEntries(keys.map(k => [k, []]));
+        const traitCols = keys.slice(4).map(k => cols[k]);
+        const rows = document.querySelectorAll('tr[id^="tr_"]');
+
+        for (const row of rows) {
+            let registration = null;
+            let registrationUrl = null;
+            let tattoo = null;
+            let name = null;
+
+            // Extract animal registration and name from first cell
+            const firstCell = row.querySelector('td:first-child');
+            if (firstCell) {
+                const regLink = firstCell.querySelector('a');
+                if (regLink) {
+                    registration = regLink.textContent.trim();
+                    registrationUrl = regLink.href;
+                }
+
+                // Extract tattoo and name from nested table
+                const nestedTable = firstCell.querySelector('table');
+                if (nestedTable) {
+                    const tattooRow = nestedTable.querySelector('tr:nth-child(2) td');
+                    if (tattooRow) tattoo = tattooRow.textContent.trim();
+                    const nameRow = nestedTable.querySelector('tr:nth-child(3) td');
+                    if (nameRow) name = nameRow.textContent.trim();
+                }
+            }
+            cols.registration.push(registration);
+            cols.registration_url.push(registrationUrl);
+            cols.tattoo.push(tattoo);
+            cols.name.push(name);
+
+            // EPD, change, accuracy and rank per trait; a trait cell that is
+            // missing or incomplete leaves all four of its columns null
+            const epdCells = row.querySelectorAll('td[style*="border-left:thin"]');
+            for (let i = 0; i < traitCount; i++) {
+                // Walk the table's row/cell collections rather than running selectors per cell
+                const nestedTable = i < epdCells.length ? epdCells[i].querySelector('table') : null;
+                const traitRows = nestedTable ? nestedTable.rows : null;
+                const complete = traitRows !== null && traitRows.length >= 4;
+                for (let j = 0; j < 4; j++) {
+                    traitCols[i * 4 + j].push(complete ? traitRows[j].cells[0]?.textContent.trim() || '' : null);
+                }
+            }
+        }
+
+        // Serialized in the page so the payload is decoded once, by _loads
+        return JSON.stringify(cols);
+    }
+"""
+
+_EXTRACT_ANIMAL_JS = """
+    () => {
+        const details = {};
+        const HERD_RE = /Herd Prefix:[^\\n]{0,60}?Tattoo[^:]{0,20}:\\s*([A-Z]+)\\s*:\\s*([A-Z0-9]+)/;
+        const LABELS = new Map([
+            ['Sex:', 'sex'],
+            ['Name:', 'name'],
+            ['Registration:', 'registration'],
+            ['International ID:', 'international_id'],
+            ['EID:', 'eid'],
+            ['Horn/Poll/Scur:', 'horn_poll_scur'],
+            ['Shorthorn %:', 'shorthorn_percent'],
+            ['COI:', 'coi'],
+            ['Service Type:', 'service_type'],
+            ['Status:', 'status'],
+            ['Color:', 'color'],
+            ['DOB:', 'dob'],
+            ['Disposal:', 'disposal'],
+        ]);
+
+        // Single pass over rows whose text is read once: label/value pairs
+        // plus the first Sire/Dam/Breeder/Herd Prefix rows
+        const rows = Array.from(document.querySelectorAll('tr'));
+        const texts = rows.map(row => row.textContent);
+        let sireIdx = -1;
+        let damIdx = -1;
+        let breederIdx = -1;
+        let herdIdx = -1;
+        for (let i = 0; i < rows.length; i++) {
+            const cells = rows[i].querySelectorAll('td');
+            if (cells.length >= 2) {
+                const field = LABELS.get(cells[0].textContent.trim());
+                if (field) {
+                    const value = cells[1].textContent.trim();
+                    if (value) details[field] = value;
+                }
+            }
+            const text = texts[i];
+            if (sireIdx < 0 && text.includes('Sire:')) sireIdx = i;
+            if (damIdx < 0 && text.includes('Dam:')) damIdx = i;
+            if (breederIdx < 0 && text.includes('Breeder:')) breederIdx = i;
+            if (herdIdx < 0 && (text.includes('Herd Prefix:') || text.includes('Tattoo'))) herdIdx = i;
+        }
+
+        // Extract Sire and Dam info
+        if (sireIdx >= 0) {
+            const sireLink = rows[sireIdx].querySelector('a');
+            if (sireLink) {
+                details.sire_registration = sireLink.textContent.trim();
+                details.sire_name = texts[sireIdx].split('&nbsp;').pop()?.trim() || '';
+            }
+        }
+        if (damIdx >= 0) {
+            const damLink = rows[damIdx].querySelector('a');
+            if (damLink) {
+                details.dam_registration = damLink.textContent.trim();
+                details.dam_name = texts[damIdx].split('&nbsp;').pop()?.trim() || '';
+            }
+        }
+
+        // Extract Breeder info
+        if (breederIdx >= 0) {
+            const breederLink = rows[breederIdx].querySelector('a');
+            if (breederLink) {
+                details.breeder_id = breederLink.textContent.trim();
+                details.breeder_name = texts[breederIdx].split('(').pop()?.split(')')[0]?.trim() || '';
+            }
+        }
+
+        // Extract Herd Prefix and Tattoo info
+        if (herdIdx >= 0) {
+            const prefixMatch = HERD_RE.exec(texts[herdIdx]);
+            if (prefixMatch) {
+                details.herd_prefix = prefixMatch[1];
+                details.tattoo = prefixMatch[2];
+            }
+        }
+
+        return details;
+    }
+"""
+
+# Installed on every search page so extraction only sends a short call over CDP
+_PAGE_INIT_SCRIPT = f'window.__EPD_TRAITS = {json.dumps(EPD_TRAITS)};\nwindow.__extractEpdTable = {_EXTRACT_TABLE_JS.strip()};'
+_CALL_EXTRACT_TABLE_JS = '() => window.__extractEpdTable ? window.__extractEpdTable() : null'
+
+# Resolves to 'ok' once result rows exist, 'none' once a no-results/error marker shows up
+_RESULTS_STATE_SCRIPT = """
+    () => {
+        if (document.querySelector('tr[id^="tr_"]')) return 'ok';
+        if (document.querySelector('.no-results, .no-data, .error')) return 'none';
+        return false;
+    }
+"""
+_RESULTS_TIMEOUT_MS = 120000
+
+# Drops the previous search's rows and any no-results/error marker, so _RESULTS_STATE_SCRIPT only
+# sees what the next search renders. Markers are only cleared inside the results container, leaving
+# form and validation errors elsewhere on the page alone.
+_CLEAR_RESULTS_SCRIPT = """
+    () => {
+        document.querySelectorAll('tr[id^="tr_"]').forEach(el => el.remove());
+        const results = document.querySelector('#dvSearchResults');
+        if (results) results.querySelectorAll('.no-results, .no-data, .error').forEach(el => el.remove());
+        const form = document.querySelector('#epd_search');
+        if (form) form.reset();
+    }
+"""
+
+_SEP80 = '=' * 80
+_SEP40 = '-' * 40
+_SEP30 = '-' * 30
+_GROWTH_HDR = 'Growth & Maternal EPDs:'
+_GROWTH_TRAITS = ('CED', 'BW', 'WW', 'YW', 'MK', 'TM', 'CEM', 'ST')
+_CARCASS_HDR = 'Carcass EPDs:'
+_CARCASS_TRAITS = ('YG', 'CW', 'REA', 'FAT', 'MB')
+_INDEX_HDR = 'Index EPDs:'
+_INDEX_TRAITS = ('CEZ', 'BMI', 'CPI', 'F')
+_TRAIT_LINE = '  {trait:>3}: EPD={epd:>6} | Change={change:>6} | Acc={acc:>5} | Rank={rank:>4}'
+
+_DETAIL_SECTIONS = (
+    ('BASIC INFORMATION:', (('Registration', 'registration'), ('Name', 'name'), ('Sex', 'sex'), ('Color', 'color'), ('International ID', 'international_id'), ('EID', 'eid'), ('Horn/Poll/Scur', 'horn_poll_scur'), ('Shorthorn %', 'shorthorn_percent'), ('COI', 'coi'))),
+    ('HERD INFORMATION:', (('Herd Prefix', 'herd_prefix'), ('Tattoo', 'tattoo'))),
+    ('PARENT INFORMATION:', (('Sire Registration', 'sire_registration'), ('Sire Name', 'sire_name'), ('Dam Registration', 'dam_registration'), ('Dam Name', 'dam_name'))),
+    ('BREEDER INFORMATION:', (('Breeder ID', 'breeder_id'), ('Breeder Name', 'breeder_name'))),
+    ('DATES AND STATUS:', (('Date of Birth', 'dob'), ('Disposal Date', 'disposal'), ('Service Type', 'service_type'), ('Status', 'status'))),
+)
+
+def _trait_keys(traits: Tuple[str, ...], prefix: str='') -> Tuple[Tuple[str, str, str, str, str], ...]:
+    return tuple((t, f'{prefix}{t}_epd', f'{prefix}{t}_change', f'{prefix}{t}_acc', f'{prefix}{t}_rank') for t in traits)
+
+# Index traits are scraped under their '$'-prefixed column names ('$CEZ_epd', ...)
+_TRAIT_KEYS = {'growth': _trait_keys(_GROWTH_TRAITS), 'carcass': _trait_keys(_CARCASS_TRAITS), 'index': _trait_keys(_INDEX_TRAITS, '$')}
+
+def _loads(payload: str) -> Any:
+    return orjson.loads(payload) if HAVE_ORJSON else json.loads(payload)
+
+def to_records(columns: Dict[str, List[Optional[str]]]) -> List[Dict[str, str]]:
+    """Convert columnar results to one dict per animal, dropping missing (None) values and empty rows."""
+    keys = tuple(columns)
+    records = []
+    for values in zip(*columns.values()):
+        record = {key: value for key, value in zip(keys, values) if value is not None}
+        if record:
+            records.append(record)
+    return records
 
 class EPDSearchScraper:
 
-    def __init__(self, base_url: str='https://shorthorn.digitalbeef.com'):
+    def __init__(self, base_url: str='https://shorthorn.digitalbeef.com', detail_cache_ttl: Optional[float]=None, cache_dir: Optional[str]=DEFAULT_CACHE_DIR, cache_ttl: float=DEFAULT_CACHE_TTL):
         self.base_url = base_url
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.detail_cache_ttl = detail_cache_ttl
+        self._detail_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
         self.form_parser = EPDFormParser()
         self.browser = None
         self.playwright = None
+        self._page: Optional[Page] = None
+        self._form_validated: Set[str] = set()
 
     async def init_browser(self) -> Tuple[Browser, any]:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True)
-        return (browser, playwright)
+        return await BrowserManager.get()
+
+    async def _ensure_browser(self) -> None:
+        self.browser, self.playwright = await self.init_browser()
+
+    async def prepare_page(self, page: Page) -> None:
+        await block_resources(page)
+        await page.add_init_script(_PAGE_INIT_SCRIPT)
 
     async def navigate_to_site(self, page: Page) -> bool:
         try:
-            print(f'Navigating to {self.base_url}')
-            await page.goto(self.base_url, wait_until='networkidle')
+            logger.info('Navigating to %s', self.base_url)
+            await page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
             return True
         except Exception as e:
-            print(f'Error navigating to site: {e}')
+            logger.error('Error navigating to site: %s', e)
             return False
 
     async def wait_for_epd_form_ready(self, page: Page) -> bool:
         try:
             await page.wait_for_selector('#epd_search', timeout=10000)
-            print('EPD Search form loaded successfully')
+            logger.info('EPD Search form loaded successfully')
             return True
         except Exception as e:
-            print(f'Error waiting for EPD form: {e}')
+            logger.error('Error waiting for EPD form: %s', e)
             return False
 
     async def validate_form_structure(self, page: Page) -> Tuple[bool, List[str]]:
@@ -40,147 +278,232 @@ class EPDSearchScraper:
 
     async def fill_search_form(self, page: Page, search_params: Dict[str, str]) -> bool:
         try:
-            print('Filling EPD search form...')
+            logger.info('Filling EPD search form...')
             success = await self.form_parser.fill_epd_form(page, search_params)
             if success:
-                print('EPD search form filled successfully')
+                logger.info('EPD search form filled successfully')
             else:
-                print('Failed to fill EPD search form')
+                logger.warning('Failed to fill EPD search form')
             return success
         except Exception as e:
-            print(f'Error filling EPD search form: {e}')
+            logger.error('Error filling EPD search form: %s', e)
             return False
 
     async def trigger_search(self, page: Page) -> bool:
         try:
-            print('Triggering EPD search...')
+            logger.info('Triggering EPD search...')
             await page.evaluate('doSearch_Epd();')
-            print('EPD search triggered successfully')
+            logger.info('EPD search triggered successfully')
             return True
         except Exception as e:
-            print(f'Error triggering EPD search: {e}')
+            logger.error('Error triggering EPD search: %s', e)
             return False
 
+    async def _progress_ticker(self, interval: float) -> None:
+        started = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            logger.info('Still waiting for results... (%.0fs elapsed)', time.monotonic() - started)
+
     async def wait_for_results(self, page: Page) -> bool:
+        progress = asyncio.create_task(self._progress_ticker(10))
         try:
-            print('Waiting for EPD search results...')
-            max_wait_time = 120
-            check_interval = 2
-            elapsed_time = 0
-            while elapsed_time < max_wait_time:
-                has_results = await page.evaluate('\n                    () => {\n                        const resultRows = document.querySelectorAll(\'tr[id^="tr_"]\');\n                        return resultRows.length > 0;\n                    }\n                ')
-                if has_results:
-                    print(f'EPD search results loaded successfully after {elapsed_time} seconds')
-                    return True
-                no_results = await page.evaluate("\n                    () => {\n                        const noResultsMsg = document.querySelector('.no-results, .no-data, .error');\n                        const loadingMsg = document.querySelector('.loading, .processing');\n                        return {\n                            noResults: noResultsMsg !== null,\n                            loading: loadingMsg !== null\n                        };\n                    }\n                ")
-                if no_results['noResults']:
-                    print('No EPD results found')
-                    return True
-                if not no_results['loading']:
-                    await page.wait_for_timeout(1000)
-                    elapsed_time += 1
-                    continue
-                await page.wait_for_timeout(check_interval * 1000)
-                elapsed_time += check_interval
-                if elapsed_time % 10 == 0:
-                    print(f'Still waiting for results... ({elapsed_time}s elapsed)')
-            print(f'Search timeout after {max_wait_time} seconds')
+            logger.info('Waiting for EPD search results...')
+            started = time.monotonic()
+            try:
+                state = await page.wait_for_function(_RESULTS_STATE_SCRIPT, timeout=_RESULTS_TIMEOUT_MS, polling=250)
+            except PlaywrightTimeoutError:
+                logger.warning('Search timeout after %s seconds', _RESULTS_TIMEOUT_MS // 1000)
+                return True
+            if await state.json_value() == 'none':
+                logger.info('No EPD results found')
+                return True
+            logger.info('EPD search results loaded successfully after %.0f seconds', time.monotonic() - started)
             return True
         except Exception as e:
-            print(f'Error waiting for EPD results: {e}')
+            logger.error('Error waiting for EPD results: %s', e)
             return False
+        finally:
+            progress.cancel()
+
+    async def extract_table_columns(self, page: Page) -> Dict[str, List[Optional[str]]]:
+        payload = await page.evaluate(_CALL_EXTRACT_TABLE_JS)
+        if payload is None:
+            await page.evaluate(_PAGE_INIT_SCRIPT)
+            payload = await page.evaluate(_CALL_EXTRACT_TABLE_JS)
+        columns = _loads(payload)
+        return {key: [' '.join(value.split()) if isinstance(value, str) else value for value in column] for key, column in columns.items()}
 
     async def extract_table_data(self, page: Page) -> List[Dict[str, str]]:
         try:
-            epd_data = await page.evaluate('\n                () => {\n                    const results = [];\n                    const rows = document.querySelectorAll(\'tr[id^="tr_"]\');\n                    \n                    for (const row of rows) {\n                        const animalData = {};\n                        \n                        // Extract animal registration and name from first cell\n                        const firstCell = row.querySelector(\'td:first-child\');\n                        if (firstCell) {\n                            const regLink = firstCell.querySelector(\'a\');\n                            if (regLink) {\n                                animalData[\'registration\'] = regLink.textContent.trim();\n                                animalData[\'registration_url\'] = regLink.href;\n                            }\n                            \n                            // Extract tattoo and name from nested table\n                            const nestedTable = firstCell.querySelector(\'table\');\n                            if (nestedTable) {\n                                const tattooRow = nestedTable.querySelector(\'tr:nth-child(2) td\');\n                                if (tattooRow) {\n                                    animalData[\'tattoo\'] = tattooRow.textContent.trim();\n                                }\n                                \n                                const nameRow = nestedTable.querySelector(\'tr:nth-child(3) td\');\n                                if (nameRow) {\n                                    animalData[\'name\'] = nameRow.textContent.trim();\n                                }\n                            }\n                        }\n                        \n                        // Extract EPD values from cells with border-left:thin style\n                        const epdCells = row.querySelectorAll(\'td[style*="border-left:thin"]\');\n                        const traits = [\'CED\', \'BW\', \'WW\', \'YW\', \'MK\', \'TM\', \'CEM\', \'ST\', \'YG\', \'CW\', \'REA\', \'FAT\', \'MB\', \'$CEZ\', \'$BMI\', \'$CPI\', \'$F\'];\n                        \n                        for (let i = 0; i < epdCells.length && i < traits.length; i++) {\n                            const cell = epdCells[i];\n                            const trait = traits[i];\n                            \n                            const nestedTable = cell.querySelector(\'table\');\n                            if (nestedTable) {\n                                const rows = nestedTable.querySelectorAll(\'tr\');\n                                \n                                if (rows.length >= 4) {\n                                    // EPD value (first row)\n                                    const epdValue = rows[0]?.querySelector(\'td\')?.textContent.trim() || \'\';\n                                    animalData[`${trait}_epd`] = epdValue;\n                                    \n                                    // Change value (second row)\n                                    const changeValue = rows[1]?.querySelector(\'td\')?.textContent.trim() || \'\';\n                                    animalData[`${trait}_change`] = changeValue;\n                                    \n                                    // Accuracy (third row)\n                                    const accuracy = rows[2]?.querySelector(\'td\')?.textContent.trim() || \'\';\n                                    animalData[`${trait}_acc`] = accuracy;\n                                    \n                                    // Rank (fourth row)\n                                    const rank = rows[3]?.querySelector(\'td\')?.textContent.trim() || \'\';\n                                    animalData[`${trait}_rank`] = rank;\n                                }\n                            }\n                        }\n                        \n                        if (Object.keys(animalData).length > 0) {\n                            results.push(animalData);\n                        }\n                    }\n                    \n                    return results;\n                }\n            ')
-            cleaned_data = clean_table_data(epd_data)
-            print(f'Found {len(cleaned_data)} EPD entries')
-            return cleaned_data
+            epd_data = to_records(await self.extract_table_columns(page))
+            logger.info('Found %d EPD entries', len(epd_data))
+            return epd_data
         except Exception as e:
-            print(f'Error extracting EPD table data: {e}')
+            logger.error('Error extracting EPD table data: %s', e)
             return []
 
-    async def scrape_epd(self, search_params: Dict[str, str]) -> List[Dict[str, str]]:
+    async def clear_previous_results(self, page: Page) -> None:
+        await page.evaluate(_CLEAR_RESULTS_SCRIPT)
+
+    def _results_cache_path(self, search_params: Dict[str, str]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha1((self.base_url + json.dumps(search_params, sort_keys=True)).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def _read_cached_results(self, path: str) -> Optional[List[Dict[str, str]]]:
+        results = read_json_cache(path, self.cache_ttl)
+        if results is not None:
+            try:
+                # a hit counts as recent use, so pruning drops the least recently used entries
+                os.utime(path)
+            except OSError:
+                pass
+        return results
+
+    def _write_cached_results(self, path: str, results: List[Dict[str, str]]) -> None:
         try:
-            self.browser, self.playwright = await self.init_browser()
-            page = await self.browser.new_page()
-            if not await self.navigate_to_site(page):
-                return []
-            if not await self.wait_for_epd_form_ready(page):
-                return []
+            write_json_cache(path, results)
+            entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+            if len(entries) > MAX_CACHE_ENTRIES:
+                entries.sort(key=os.path.getmtime)
+                for stale in entries[:len(entries) - MAX_CACHE_ENTRIES]:
+                    os.remove(stale)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning('Could not write EPD results cache: %s', e)
+
+    async def _open_search_form(self, page: Page) -> bool:
+        await self.prepare_page(page)
+        if not await self.navigate_to_site(page):
+            return False
+        if not await self.wait_for_epd_form_ready(page):
+            return False
+        # The form layout is fixed per site, so one successful validation covers later pages and contexts
+        if self.base_url not in self._form_validated:
             is_valid, missing_fields = await self.validate_form_structure(page)
             if not is_valid:
-                print(f'Missing required EPD fields: {missing_fields}')
-                return []
-            if not await self.fill_search_form(page, search_params):
-                return []
-            if not await self.trigger_search(page):
-                return []
-            if not await self.wait_for_results(page):
-                return []
-            results = await self.extract_table_data(page)
-            return results
+                logger.error('Missing required EPD fields: %s', missing_fields)
+                return False
+            self._form_validated.add(self.base_url)
+        return True
+
+    async def _run_search(self, page: Page, search_params: Dict[str, str]) -> List[Dict[str, str]]:
+        if not await self.fill_search_form(page, search_params):
+            return []
+        if not await self.trigger_search(page):
+            return []
+        if not await self.wait_for_results(page):
+            return []
+        return await self.extract_table_data(page)
+
+    async def _search_cached(self, search_params: Dict[str, str], force_refresh: bool, search) -> List[Dict[str, str]]:
+        cache_path = self._results_cache_path(search_params)
+        if cache_path and not force_refresh:
+            cached = self._read_cached_results(cache_path)
+            if cached is not None:
+                logger.info('Using cached EPD results (%d entries)', len(cached))
+                return cached
+        results = await search(search_params)
+        if cache_path and results:
+            self._write_cached_results(cache_path, results)
+        return results
+
+    async def _search_on_shared_page(self, search_params: Dict[str, str]) -> List[Dict[str, str]]:
+        page = self._page
+        try:
+            if page is not None and not page.is_closed():
+                await self.clear_previous_results(page)
+            else:
+                await self._ensure_browser()
+                page = await self.browser.new_page()
+                if not await self._open_search_form(page):
+                    await self._close_page(page)
+                    return []
+                self._page = page
+            return await self._run_search(page, search_params)
         except Exception as e:
-            print(f'Error during EPD scraping: {e}')
+            logger.error('Error during EPD scraping: %s', e)
+            # the page may be stuck mid-search; the next search opens a fresh one
+            self._page = None
+            await self._close_page(page)
             return []
-        finally:
-            if self.browser:
-                try:
-                    await self.browser.close()
-                except Exception as e:
-                    print(f'Warning: Error closing browser: {e}')
-            if self.playwright:
-                try:
-                    await self.playwright.stop()
-                except Exception as e:
-                    print(f'Warning: Error stopping playwright: {e}')
+
+    async def _search_in_context(self, search_params: Dict[str, str], gate: asyncio.Semaphore) -> List[Dict[str, str]]:
+        async with gate:
+            context = None
+            try:
+                context = await self.browser.new_context(viewport={'width': 800, 'height': 600})
+                page = await context.new_page()
+                if not await self._open_search_form(page):
+                    return []
+                return await self._run_search(page, search_params)
+            except Exception as e:
+                logger.error('Error during EPD scraping: %s', e)
+                return []
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+
+    async def scrape_epd(self, search_params: Dict[str, str], force_refresh: bool=False) -> List[Dict[str, str]]:
+        # A single search reuses one warm page across calls; batches go through scrape_epd_many
+        return await self._search_cached(search_params, force_refresh, self._search_on_shared_page)
+
+    async def scrape_epd_many(self, params_list: List[Dict[str, str]], max_parallel: int=4, force_refresh: bool=False) -> List[List[Dict[str, str]]]:
+        await self._ensure_browser()
+        gate = asyncio.Semaphore(max(1, max_parallel))
+
+        async def search(search_params: Dict[str, str]) -> List[Dict[str, str]]:
+            return await self._search_in_context(search_params, gate)
+        return list(await asyncio.gather(*(self._search_cached(params, force_refresh, search) for params in params_list)))
+
+    async def _close_page(self, page: Optional[Page]) -> None:
+        if page is not None and not page.is_closed():
+            try:
+                await page.close()
+            except Exception as e:
+                logger.warning('Error closing page: %s', e)
+
+    async def close(self) -> None:
+        # The browser itself is shared through BrowserManager; only release this scraper's page
+        page, self._page = (self._page, None)
+        await self._close_page(page)
+        self.browser = None
+        self.playwright = None
+
+    def _fmt_group(self, animal: Dict[str, str], title: str, keys: Tuple[Tuple[str, str, str, str, str], ...]) -> Iterator[str]:
+        yield ''
+        yield title
+        get = animal.get
+        for trait, k_epd, k_change, k_acc, k_rank in keys:
+            yield _TRAIT_LINE.format(trait=trait, epd=get(k_epd, 'N/A'), change=get(k_change, 'N/A'), acc=get(k_acc, 'N/A'), rank=get(k_rank, 'N/A'))
+
+    def _lines(self, results: List[Dict[str, str]]) -> Iterator[str]:
+        yield _SEP80
+        yield 'EPD SEARCH RESULTS'
+        yield _SEP80
+        yield f'Total Animals Found: {len(results)}'
+        yield ''
+        for i, animal in enumerate(results, 1):
+            yield f'Animal #{i}'
+            yield _SEP40
+            yield f"Registration: {animal.get('registration', 'N/A')}"
+            yield f"Tattoo: {animal.get('tattoo', 'N/A')}"
+            yield f"Name: {animal.get('name', 'N/A')}"
+            yield from self._fmt_group(animal, _GROWTH_HDR, _TRAIT_KEYS['growth'])
+            yield from self._fmt_group(animal, _CARCASS_HDR, _TRAIT_KEYS['carcass'])
+            yield from self._fmt_group(animal, _INDEX_HDR, _TRAIT_KEYS['index'])
+            yield ''
+            yield _SEP80
+            yield ''
 
     def format_results(self, results: List[Dict[str, str]]) -> str:
         if not results:
             return 'No EPD results found.'
-        output = []
-        output.append('=' * 80)
-        output.append('EPD SEARCH RESULTS')
-        output.append('=' * 80)
-        output.append(f'Total Animals Found: {len(results)}')
-        output.append('')
-        for i, animal in enumerate(results, 1):
-            output.append(f'Animal #{i}')
-            output.append('-' * 40)
-            output.append(f"Registration: {animal.get('registration', 'N/A')}")
-            output.append(f"Tattoo: {animal.get('tattoo', 'N/A')}")
-            output.append(f"Name: {animal.get('name', 'N/A')}")
-            output.append('')
-            output.append('Growth & Maternal EPDs:')
-            growth_traits = ['CED', 'BW', 'WW', 'YW', 'MK', 'TM', 'CEM', 'ST']
-            for trait in growth_traits:
-                epd = animal.get(f'{trait}_epd', 'N/A')
-                change = animal.get(f'{trait}_change', 'N/A')
-                acc = animal.get(f'{trait}_acc', 'N/A')
-                rank = animal.get(f'{trait}_rank', 'N/A')
-                output.append(f'  {trait:>3}: EPD={epd:>6} | Change={change:>6} | Acc={acc:>5} | Rank={rank:>4}')
-            output.append('')
-            output.append('Carcass EPDs:')
-            carcass_traits = ['YG', 'CW', 'REA', 'FAT', 'MB']
-            for trait in carcass_traits:
-                epd = animal.get(f'{trait}_epd', 'N/A')
-                change = animal.get(f'{trait}_change', 'N/A')
-                acc = animal.get(f'{trait}_acc', 'N/A')
-                rank = animal.get(f'{trait}_rank', 'N/A')
-                output.append(f'  {trait:>3}: EPD={epd:>6} | Change={change:>6} | Acc={acc:>5} | Rank={rank:>4}')
-            output.append('')
-            output.append('Index EPDs:')
-            index_traits = ['CEZ', 'BMI', 'CPI', 'F']
-            for trait in index_traits:
-                epd = animal.get(f'{trait}_epd', 'N/A')
-                change = animal.get(f'{trait}_change', 'N/A')
-                acc = animal.get(f'{trait}_acc', 'N/A')
-                rank = animal.get(f'{trait}_rank', 'N/A')
-                output.append(f'  {trait:>3}: EPD={epd:>6} | Change={change:>6} | Acc={acc:>5} | Rank={rank:>4}')
-            output.append('')
-            output.append('=' * 80)
-            output.append('')
-        return '\n'.join(output)
+        return '\n'.join(self._lines(results))
 
     def format_results_table(self, results: List[Dict[str, str]]) -> str:
         if not results:
@@ -189,59 +512,60 @@ class EPDSearchScraper:
 
     async def extract_animal_detail(self, page: Page, animal_url: str) -> Dict[str, str]:
         try:
-            print(f'Extracting animal details from: {animal_url}')
-            await page.goto(animal_url, wait_until='networkidle')
+            logger.info('Extracting animal details from: %s', animal_url)
+            await page.goto(animal_url, wait_until='domcontentloaded', timeout=30000)
             await page.wait_for_selector('table[style*="min-width:850px"]', timeout=10000)
-            details = await page.evaluate("\n                () => {\n                    const details = {};\n                    \n                    // Extract basic identification info\n                    const rows = document.querySelectorAll('tr');\n                    for (const row of rows) {\n                        const cells = row.querySelectorAll('td');\n                        if (cells.length >= 2) {\n                            const label = cells[0]?.textContent?.trim();\n                            const value = cells[1]?.textContent?.trim();\n                            \n                            if (label && value) {\n                                if (label.includes('Sex:')) details.sex = value;\n                                if (label.includes('Name:')) details.name = value;\n                                if (label.includes('Registration:')) details.registration = value;\n                                if (label.includes('International ID:')) details.international_id = value;\n                                if (label.includes('EID:')) details.eid = value;\n                                if (label.includes('Horn/Poll/Scur:')) details.horn_poll_scur = value;\n                                if (label.includes('Shorthorn %:')) details.shorthorn_percent = value;\n                                if (label.includes('COI:')) details.coi = value;\n                                if (label.includes('Service Type:')) details.service_type = value;\n                                if (label.includes('Status:')) details.status = value;\n                                if (label.includes('Color:')) details.color = value;\n                                if (label.includes('DOB:')) details.dob = value;\n                                if (label.includes('Disposal:')) details.disposal = value;\n                            }\n                        }\n                    }\n                    \n                    // Extract Sire and Dam info\n                    const sireRow = Array.from(rows).find(row => \n                        row.textContent.includes('Sire:') || row.textContent.includes('Sire:&nbsp;')\n                    );\n                    if (sireRow) {\n                        const sireLink = sireRow.querySelector('a');\n                        if (sireLink) {\n                            details.sire_registration = sireLink.textContent.trim();\n                            details.sire_name = sireRow.textContent.split('&nbsp;').pop()?.trim() || '';\n                        }\n                    }\n                    \n                    const damRow = Array.from(rows).find(row => \n                        row.textContent.includes('Dam:') || row.textContent.includes('Dam:&nbsp;')\n                    );\n                    if (damRow) {\n                        const damLink = damRow.querySelector('a');\n                        if (damLink) {\n                            details.dam_registration = damLink.textContent.trim();\n                            details.dam_name = damRow.textContent.split('&nbsp;').pop()?.trim() || '';\n                        }\n                    }\n                    \n                    // Extract Breeder info\n                    const breederRow = Array.from(rows).find(row => \n                        row.textContent.includes('Breeder:') || row.textContent.includes('Breeder:&nbsp;')\n                    );\n                    if (breederRow) {\n                        const breederLink = breederRow.querySelector('a');\n                        if (breederLink) {\n                            details.breeder_id = breederLink.textContent.trim();\n                            details.breeder_name = breederRow.textContent.split('(').pop()?.split(')')[0]?.trim() || '';\n                        }\n                    }\n                    \n                    // Extract Herd Prefix and Tattoo info\n                    const herdPrefixRow = Array.from(rows).find(row => \n                        row.textContent.includes('Herd Prefix:') || row.textContent.includes('Tattoo')\n                    );\n                    if (herdPrefixRow) {\n                        const text = herdPrefixRow.textContent;\n                        const prefixMatch = text.match(/Herd Prefix:.*?Tattoo.*?:\\s*([A-Z]+)\\s*:\\s*([A-Z0-9]+)/);\n                        if (prefixMatch) {\n                            details.herd_prefix = prefixMatch[1];\n                            details.tattoo = prefixMatch[2];\n                        }\n                    }\n                    \n                    return details;\n                }\n            ")
-            print(f"Extracted animal details for {details.get('registration', 'Unknown')}")
+            details = await page.evaluate(_EXTRACT_ANIMAL_JS)
+            logger.info('Extracted animal details for %s', details.get('registration', 'Unknown'))
             return details
         except Exception as e:
-            print(f'Error extracting animal details: {e}')
+            logger.error('Error extracting animal details: %s', e)
             return {}
 
+    def _cached_detail(self, url: str) -> Optional[Dict[str, str]]:
+        entry = self._detail_cache.get(url)
+        if entry is None:
+            return None
+        fetched_at, details = entry
+        if self.detail_cache_ttl is not None and time.monotonic() - fetched_at > self.detail_cache_ttl:
+            del self._detail_cache[url]
+            return None
+        return details
+
+    async def _detail_one(self, url: str, pool: PagePool) -> Dict[str, str]:
+        page = await pool.acquire()
+        try:
+            return await self.extract_animal_detail(page, url)
+        finally:
+            await pool.release(page)
+
+    async def extract_animal_details_many(self, urls: List[str], concurrency: int=6) -> List[Dict[str, str]]:
+        unique = [url for url in dict.fromkeys(urls) if self._cached_detail(url) is None]
+        if unique:
+            await self._ensure_browser()
+            pool = PagePool(self.browser, max_size=min(concurrency, len(unique)))
+            try:
+                results = await asyncio.gather(*[self._detail_one(url, pool) for url in unique])
+            finally:
+                await pool.close()
+            now = time.monotonic()
+            for url, details in zip(unique, results):
+                if details:
+                    self._detail_cache[url] = (now, details)
+        return [self._cached_detail(url) or {} for url in urls]
+
+    def _emit_detail_section(self, out: List[str], details: Dict[str, str], title: str, fields: Tuple[Tuple[str, str], ...]) -> None:
+        out.append(title)
+        out.append(_SEP30)
+        get = details.get
+        out.extend(f'{label}: {get(key, "N/A")}' for label, key in fields)
+        out.append('')
+
     def format_animal_detail(self, details: Dict[str, str]) -> str:
         if not details:
             return 'No animal details found.'
-        output = []
-        output.append('=' * 80)
-        output.append('ANIMAL DETAILS')
-        output.append('=' * 80)
-        output.append('')
-        output.append('BASIC INFORMATION:')
-        output.append('-' * 30)
-        output.append(f"Registration: {details.get('registration', 'N/A')}")
-        output.append(f"Name: {details.get('name', 'N/A')}")
-        output.append(f"Sex: {details.get('sex', 'N/A')}")
-        output.append(f"Color: {details.get('color', 'N/A')}")
-        output.append(f"International ID: {details.get('international_id', 'N/A')}")
-        output.append(f"EID: {details.get('eid', 'N/A')}")
-        output.append(f"Horn/Poll/Scur: {details.get('horn_poll_scur', 'N/A')}")
-        output.append(f"Shorthorn %: {details.get('shorthorn_percent', 'N/A')}")
-        output.append(f"COI: {details.get('coi', 'N/A')}")
-        output.append('')
-        output.append('HERD INFORMATION:')
-        output.append('-' * 30)
-        output.append(f"Herd Prefix: {details.get('herd_prefix', 'N/A')}")
-        output.append(f"Tattoo: {details.get('tattoo', 'N/A')}")
-        output.append('')
-        output.append('PARENT INFORMATION:')
-        output.append('-' * 30)
-        output.append(f"Sire Registration: {details.get('sire_registration', 'N/A')}")
-        output.append(f"Sire Name: {details.get('sire_name', 'N/A')}")
-        output.append(f"Dam Registration: {details.get('dam_registration', 'N/A')}")
-        output.append(f"Dam Name: {details.get('dam_name', 'N/A')}")
-        output.append('')
-        output.append('BREEDER INFORMATION:')
-        output.append('-' * 30)
-        output.append(f"Breeder ID: {details.get('breeder_id', 'N/A')}")
-        output.append(f"Breeder Name: {details.get('breeder_name', 'N/A')}")
-        output.append('')
-        output.append('DATES AND STATUS:')
-        output.append('-' * 30)
-        output.append(f"Date of Birth: {details.get('dob', 'N/A')}")
-        output.append(f"Disposal Date: {details.get('disposal', 'N/A')}")
-        output.append(f"Service Type: {details.get('service_type', 'N/A')}")
-        output.append(f"Status: {details.get('status', 'N/A')}")
-        output.append('')
-        output.append('=' * 80)
+        output = [_SEP80, 'ANIMAL DETAILS', _SEP80, '']
+        for title, fields in _DETAIL_SECTIONS:
+            self._emit_detail_section(output, details, title, fields)
+        output.append(_SEP80)
         return '\n'.join(output)
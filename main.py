@@ -1,11 +1,23 @@
 import asyncio
+import logging
 import sys
 from typing import Optional
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import Browser, Page
+from ranch_scraper.browser import BrowserManager, block_resources
+from ranch_scraper.utils import ainput, uncancel_current_task
 from ranch_scraper.cli import RanchScraperCLI
 from epd_scraper.cli import EPDSearchCLI
 from animal_scraper.cli import AnimalSearchCLI
 
+try:
+    import uvloop
+    HAVE_UVLOOP = True
+except Exception:
+    HAVE_UVLOOP = False
+
+logger = logging.getLogger(__name__)
+VERBOSE_FLAGS = ('-v', '--verbose')
+
 class DigitalBeefScraper:
 
     def __init__(self):
@@ -16,22 +28,22 @@ class DigitalBeefScraper:
 
     async def init_browser(self) -> bool:
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(headless=True)
+            self.browser, self.playwright = await BrowserManager.get()
             self.page = await self.browser.new_page()
+            await block_resources(self.page)
             return True
         except Exception as e:
-            print(f'Error initializing browser: {e}')
+            logger.error('Error initializing browser: %s', e)
             return False
 
     async def navigate_to_site(self) -> bool:
         try:
-            print(f'Navigating to {self.base_url}')
-            await self.page.goto(self.base_url, wait_until='networkidle')
-            print('Successfully loaded Digital Beef website')
+            logger.info('Navigating to %s', self.base_url)
+            await self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
+            logger.info('Successfully loaded Digital Beef website')
             return True
         except Exception as e:
-            print(f'Error navigating to site: {e}')
+            logger.error('Error navigating to site: %s', e)
             return False
 
     def show_menu(self):
@@ -44,14 +56,16 @@ class DigitalBeefScraper:
         print('4. Exit')
         print('=' * 50)
 
-    def get_user_choice(self) -> Optional[int]:
+    async def get_user_choice(self) -> Optional[int]:
         try:
-            choice = input('Select an option [1-4]: ').strip()
+            choice = (await ainput('Select an option [1-4]: ')).strip()
             return int(choice)
         except ValueError:
             print('Invalid input. Please enter a number between 1 and 4.')
             return None
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
+            # Ctrl+C under asyncio.run cancels this task instead of raising KeyboardInterrupt
+            uncancel_current_task()
             print('\nExiting...')
             return 4
 
@@ -81,18 +95,20 @@ class DigitalBeefScraper:
 
     async def cleanup(self):
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self.page and not self.page.is_closed():
+                await self.page.close()
         except Exception as e:
-            print(f'Warning: Error during cleanup: {e}')
+            logger.warning('Error during cleanup: %s', e)
+        self.page = None
+        self.browser = None
+        self.playwright = None
+        await BrowserManager.close()
 
     async def main_loop(self):
         while True:
             try:
                 self.show_menu()
-                choice = self.get_user_choice()
+                choice = await self.get_user_choice()
                 if choice is None:
                     continue
                 if choice == 1:
@@ -106,7 +122,8 @@ class DigitalBeefScraper:
                     break
                 else:
                     print('Invalid choice. Please select 1-4.')
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                uncancel_current_task()
                 print('\nExiting...')
                 break
             except Exception as e:
@@ -133,12 +150,18 @@ class DigitalBeefScraper:
             await self.cleanup()
 
 async def main():
+    # -v/--verbose is consumed here so the ranch CLI fast path never sees it
+    verbose = any((arg in VERBOSE_FLAGS for arg in sys.argv[1:]))
+    sys.argv = [arg for arg in sys.argv if arg not in VERBOSE_FLAGS]
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format='%(message)s')
     app = DigitalBeefScraper()
     await app.run()
 if __name__ == '__main__':
     try:
+        if HAVE_UVLOOP:
+            uvloop.install()
         asyncio.run(main())
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print('\nExiting...')
     except Exception as e:
         print(f'Fatal error: {e}')
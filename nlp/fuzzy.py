@@ -1,54 +1,71 @@
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
-try:
-    from rapidfuzz import process, fuzz
-    HAVE_RAPIDFUZZ = True
-except Exception:
-    HAVE_RAPIDFUZZ = False
+from rapidfuzz import process, fuzz
+from rapidfuzz.utils import default_process
 
 
-def _ratio(a: str, b: str) -> int:
-    if HAVE_RAPIDFUZZ:
-        return int(fuzz.token_set_ratio(a, b))
-    # Fallback: simple containment score
-    a = (a or '').lower()
-    b = (b or '').lower()
-    if not a or not b:
-        return 0
-    if a in b or b in a:
-        return 80
-    return 0
+def _extract(query: str, processed: List[str], limit: int) -> List[Tuple[int, int]]:
+    # (index, score) of the best already-processed choices; the query gets the same processing
+    return [(index, int(score)) for _, score, index in process.extract(default_process(query), processed, scorer=fuzz.token_set_ratio, processor=None, limit=limit)]
 
 
 def fuzzy_choice(query: str, choices: List[str], limit: int = 5) -> List[Tuple[str, int]]:
     if not choices:
         return []
-    if HAVE_RAPIDFUZZ:
-        return [(m[0], int(m[1])) for m in process.extract(query, choices, scorer=fuzz.token_set_ratio, limit=limit)]
-    scored = [(c, _ratio(query, c)) for c in choices]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:limit]
+    return [(choices[i], score) for i, score in _extract(query, [default_process(c) for c in choices], limit)]
+
+
+class _OptionsIndex:
+    """Per-options-list data reused across location lookups."""
+
+    def __init__(self, options: List[dict]):
+        # keep the list itself so its id() cannot be reused by another list while cached
+        self.options = options
+        self.texts = [o.get('text', '') for o in options]
+        self.processed = [default_process(t) for t in self.texts]
+        self.value_by_text: Dict[str, str] = {}
+        for o in options:
+            self.value_by_text.setdefault(o.get('text'), o.get('value', ''))
+        # user_text -> (limit it was computed for, ranked (text, score) pairs)
+        self.ranked: Dict[str, Tuple[int, List[Tuple[str, int]]]] = {}
+
+
+_OPTIONS_CACHE: Dict[int, _OptionsIndex] = {}
+_OPTIONS_CACHE_MAX = 32
+
+
+def _options_index(options: List[dict]) -> _OptionsIndex:
+    index = _OPTIONS_CACHE.get(id(options))
+    if index is None or index.options is not options:
+        if len(_OPTIONS_CACHE) >= _OPTIONS_CACHE_MAX:
+            _OPTIONS_CACHE.clear()
+        index = _OPTIONS_CACHE[id(options)] = _OptionsIndex(options)
+    return index
+
+
+def _ranked_locations(user_text: str, options: List[dict], limit: int) -> Tuple[List[Tuple[str, int]], Dict[str, str]]:
+    index = _options_index(options)
+    cached = index.ranked.get(user_text)
+    # a longer ranking answers any smaller limit; a short one only if it already covers every choice
+    if cached is None or (cached[0] < limit and len(cached[1]) == cached[0]):
+        top = _extract(user_text, index.processed, limit) if options else []
+        cached = (limit, [(index.texts[i], score) for i, score in top])
+        index.ranked[user_text] = cached
+    return cached[1][:limit], index.value_by_text
 
 
 def best_location_match(user_text: str, options: List[dict]) -> Optional[Tuple[str, int]]:
     # options: [{value, text}]
-    texts = [o.get('text', '') for o in options]
-    scored = fuzzy_choice(user_text, texts, limit=1)
+    scored, value_by_text = _ranked_locations(user_text, options, 1)
     if not scored:
         return None
     best_text, score = scored[0]
     # find option with this text
-    for o in options:
-        if o.get('text') == best_text:
-            return (o.get('value', ''), score)
+    if best_text in value_by_text:
+        return (value_by_text[best_text], score)
     return None
 
 
 def suggest_locations(user_text: str, options: List[dict], limit: int = 5) -> List[Tuple[str, str, int]]:
-    texts = [o.get('text', '') for o in options]
-    top = fuzzy_choice(user_text, texts, limit=limit)
-    out: List[Tuple[str, str, int]] = []
-    for text, score in top:
-        val = next((o['value'] for o in options if o.get('text') == text), '')
-        out.append((val, text, score))
-    return out 
\ No newline at end of file
+    top, value_by_text = _ranked_locations(user_text, options, limit)
+    return [(value_by_text.get(text, ''), text, score) for text, score in top]
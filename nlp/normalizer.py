@@ -1,18 +1,17 @@
-import re
+from functools import lru_cache
 from typing import List
 
-WHITESPACE_RE = re.compile(r"\s+")
-PUNCT_RE = re.compile(r"[“”‘’\-–—'\"`]+")
+# quotes and dashes read as word separators
+PUNCT_TABLE = str.maketrans(dict.fromkeys("“”‘’-–—'\"`", " "))
 
 
+@lru_cache(maxsize=2048)
 def normalize_text(text: str) -> str:
     if not text:
         return ""
-    text = text.strip().lower()
-    text = PUNCT_RE.sub(" ", text)
-    text = WHITESPACE_RE.sub(" ", text)
-    return text.strip()
+    # split() drops leading/trailing whitespace and collapses runs, so no regex pass is needed
+    return " ".join(text.lower().translate(PUNCT_TABLE).split())
 
 
 def tokenize(text: str) -> List[str]:
-    return normalize_text(text).split() 
\ No newline at end of file
+    return normalize_text(text).split()
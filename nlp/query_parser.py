@@ -1,5 +1,6 @@
 import re
-from typing import Dict, Tuple, Optional
+from functools import lru_cache, wraps
+from typing import Callable, Dict, Tuple, Optional, Pattern
 from .normalizer import normalize_text
 from .vocab import STATE_ALIASES, SEX_SYNONYMS, TRAIT_SYNONYMS, SORT_FIELD_ALIASES
 
@@ -14,111 +15,190 @@ COMPARATORS = [
     (re.compile(r"<"), '<'),
 ]
 
-NUM_RE = re.compile(r"(?P<comp>>=|<=|>|<|=)?\s*(?P<num>\d+(?:\.\d+)?)")
+NUM_RE = re.compile(r"(?P<comp>>=|<=|>|<|=)?\s*(?P<num>\d+(?:\.\d+)?)", re.ASCII)
 
+# field extractors, compiled once instead of looked up in re's pattern cache per call; re.ASCII keeps \d to
+# the 0-9 the site's numeric inputs accept, while \b patterns stay Unicode-aware for accented words
+_LOC_HINT_RE = re.compile(r"\b(in|near|at)\s+([a-z\s]+)")
+_PREFIX_RE = re.compile(r"prefix\s+([a-z0-9\*\-]+)", re.ASCII)
+_NAMED_RE = re.compile(r"ranch(?:es)?\s+named\s+([a-z0-9\*\-]+)", re.ASCII)
+_CITY_RE = re.compile(r"\bcity\s+([a-z\s]+)")
+_MEMBER_RE = re.compile(r"member\s*id\s*([0-9\-]+)", re.ASCII)
+_EID_RE = re.compile(r"eid\s*([a-z0-9\*\-]+)", re.ASCII)
+_TATTOO_RE = re.compile(r"tattoo\s*([a-z0-9\*\-]+)", re.ASCII)
+_REG_RE = re.compile(r"(reg(?:istration)?\s*#?\s*)([a-z0-9\*\-]+)", re.ASCII)
+_ANIMAL_NAME_RE = re.compile(r"name\s+([a-z0-9\*\-]+)", re.ASCII)
+_BORN_RE = re.compile(r"born\s+(\d{4})", re.ASCII)
+_SORT_RE = re.compile(r"sort\s+by\s+([a-z\s$]+)", re.ASCII)
 
-def classify_intent(query: str) -> str:
+
+def _field_key(canonical: str) -> str:
+    return canonical.lower().replace(' ', '_').replace('$', '')
+
+
+# alias -> (alias followed by an optional comparator and a number, form field key base)
+_TRAIT_PATTERNS: Dict[str, Tuple[Pattern[str], str]] = {
+    alias: (re.compile(rf"{re.escape(alias)}\s*(>=|<=|>|<|=)?\s*(\d+(?:\.\d+)?)", re.ASCII), _field_key(canonical))
+    for alias, canonical in TRAIT_SYNONYMS.items()
+}
+# cheap prefilter: most queries mention no trait at all
+_ANY_TRAIT_RE = re.compile('|'.join(map(re.escape, TRAIT_SYNONYMS)))
+
+
+def _vocab_re(vocab: Dict[str, str]) -> Pattern[str]:
+    # whole-token alternation (same boundaries as the old f" {k} " in f" {q} " checks), longest alias first
+    alternation = '|'.join(map(re.escape, sorted(vocab, key=len, reverse=True)))
+    return re.compile(rf"(?<!\S)({alternation})(?!\S)", re.ASCII)
+
+
+def _vocab_lookup(pattern: Pattern[str], vocab: Dict[str, str], q: str) -> Optional[str]:
+    # on several hits, the alias listed first in the vocab wins, as with the old in-order scan
+    hits = pattern.findall(q)
+    if not hits:
+        return None
+    order = list(vocab)
+    return vocab[min(hits, key=order.index)]
+
+
+_STATE_RE = _vocab_re(STATE_ALIASES)
+# sex synonyms are single words, so a token lookup replaces the regex scan
+_SEX_ORDER = {token: i for i, token in enumerate(SEX_SYNONYMS)}
+
+
+@lru_cache(maxsize=2048)
+def _prepare(query: str) -> Tuple[str, Tuple[str, ...]]:
+    # normalized text and its tokens, shared by the intent classifier and all parsers
     q = normalize_text(query)
-    if any(w in q for w in ['epd', 'weaning', 'yearling', 'milk', 'marbling', 'ced', 'ww', 'yw']):
-        return INTENT_EPD
-    if any(w in q for w in ['bull', 'bulls', 'female', 'cow', 'eid', 'tattoo', 'registration']):
-        return INTENT_ANIMAL
-    return INTENT_RANCH
+    return q, tuple(q.split())
+
+
+def _sex_from_tokens(tokens: Tuple[str, ...]) -> Optional[str]:
+    # the synonym listed first in SEX_SYNONYMS wins, as with the old in-order scan
+    hits = [t for t in tokens if t in _SEX_ORDER]
+    if not hits:
+        return None
+    return SEX_SYNONYMS[min(hits, key=_SEX_ORDER.__getitem__)]
+
+
+def _cached_params(parse: Callable[[str], Dict[str, str]]) -> Callable[[str], Dict[str, str]]:
+    # re-submitted queries skip parsing; the cache holds immutable items and callers get a fresh dict
+    cached = lru_cache(maxsize=512)(lambda query: tuple(parse(query).items()))
+
+    @wraps(parse)
+    def wrapper(query: str) -> Dict[str, str]:
+        return dict(cached(query))
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+# intent keywords match anywhere in the text (plain substrings, no token boundaries); the
+# zero-width lookahead tries every position so an animal word cannot hide an overlapping EPD word
+_INTENT_RE = re.compile(
+    r"(?=(?P<epd>epd|weaning|yearling|milk|marbling|ced|ww|yw)"
+    r"|(?P<animal>bull|bulls|female|cow|eid|tattoo|registration))"
+)
+
+
+@lru_cache(maxsize=512)
+def classify_intent(query: str) -> str:
+    q, _ = _prepare(query)
+    # any EPD keyword wins; otherwise any animal keyword
+    intent = INTENT_RANCH
+    for m in _INTENT_RE.finditer(q):
+        if m.lastgroup == 'epd':
+            return INTENT_EPD
+        intent = INTENT_ANIMAL
+    return intent
 
 
 def _extract_location(q: str) -> Optional[str]:
     # map common state aliases fast
-    for k, v in STATE_ALIASES.items():
-        if f" {k} " in f" {q} ":
-            return v
+    state = _vocab_lookup(_STATE_RE, STATE_ALIASES, q)
+    if state is not None:
+        return state
     # look for 'in X' or 'near X' tokens as a hint (return raw; final mapping done by fuzzy layer in UI)
-    m = re.search(r"\b(in|near|at)\s+([a-z\s]+)", q)
+    m = _LOC_HINT_RE.search(q)
     if m:
         return m.group(2).strip()
     return None
 
 
+@_cached_params
 def parse_query_for_ranch(query: str) -> Dict[str, str]:
-    q = normalize_text(query)
+    q, _ = _prepare(query)
     params: Dict[str, str] = {}
     # name/prefix
-    m = re.search(r"prefix\s+([a-z0-9\*\-]+)", q)
+    m = _PREFIX_RE.search(q)
     if m:
         params['prefix'] = m.group(1).upper()
-    m = re.search(r"ranch(?:es)?\s+named\s+([a-z0-9\*\-]+)", q)
+    m = _NAMED_RE.search(q)
     if m:
         params['name'] = m.group(1).upper()
     # city
-    m = re.search(r"\bcity\s+([a-z\s]+)", q)
+    m = _CITY_RE.search(q)
     if m:
         params['city'] = m.group(1).strip().upper()
     # member id
-    m = re.search(r"member\s*id\s*([0-9\-]+)", q)
+    m = _MEMBER_RE.search(q)
     if m:
         params['member_id'] = m.group(1).upper()
-    # location
+    # location (a state alias, when present, takes precedence over the in/near/at hint)
     loc_hint = _extract_location(q)
     if loc_hint:
         params['location'] = loc_hint
-    # weak: if only a state token present
-    for k, v in STATE_ALIASES.items():
-        if f" {k} " in f" {q} ":
-            params['location'] = v
-            break
     return params
 
 
+@_cached_params
 def parse_query_for_animal(query: str) -> Dict[str, str]:
-    q = normalize_text(query)
+    q, tokens = _prepare(query)
     params: Dict[str, str] = {}
     # sex
-    for token, sex in SEX_SYNONYMS.items():
-        if f" {token} " in f" {q} ":
-            params['sex'] = sex
-            break
+    sex = _sex_from_tokens(tokens)
+    if sex is not None:
+        params['sex'] = sex
     # field/value heuristics
     if 'eid' in q:
         params['field'] = 'eid'
-        m = re.search(r"eid\s*([a-z0-9\*\-]+)", q)
+        m = _EID_RE.search(q)
         if m:
             params['value'] = m.group(1).upper()
     elif 'tattoo' in q:
         params['field'] = 'animal_private_herd_id'
-        m = re.search(r"tattoo\s*([a-z0-9\*\-]+)", q)
+        m = _TATTOO_RE.search(q)
         if m:
             params['value'] = m.group(1).upper()
     elif 'reg' in q or 'registration' in q:
         params['field'] = 'animal_registration'
-        m = re.search(r"(reg(?:istration)?\s*#?\s*)([a-z0-9\*\-]+)", q)
+        m = _REG_RE.search(q)
         if m:
             params['value'] = m.group(2).upper()
     elif 'name' in q:
         params['field'] = 'animal_name'
-        m = re.search(r"name\s+([a-z0-9\*\-]+)", q)
+        m = _ANIMAL_NAME_RE.search(q)
         if m:
             params['value'] = m.group(1).upper()
     # born year hint (stored as value suffix for now; detail filter can use later)
-    m = re.search(r"born\s+(\d{4})", q)
+    m = _BORN_RE.search(q)
     if m and 'value' in params:
         params['value'] = f"{params['value']}"
     return params
 
 
+@_cached_params
 def parse_query_for_epd(query: str) -> Dict[str, str]:
-    q = normalize_text(query)
+    q, tokens = _prepare(query)
     params: Dict[str, str] = {}
     # sex
-    for token, sex in SEX_SYNONYMS.items():
-        if f" {token} " in f" {q} ":
-            params['search_sex'] = sex
-            break
+    sex = _sex_from_tokens(tokens)
+    if sex is not None:
+        params['search_sex'] = sex
     # trait numeric filters, e.g., milk > 25, ww >= 60
-    for alias, canonical in TRAIT_SYNONYMS.items():
-        if alias in q:
-            # build key base
-            key = canonical.lower().replace(' ', '_').replace('$', '')
+    if _ANY_TRAIT_RE.search(q):
+        for alias, (pat, key) in _TRAIT_PATTERNS.items():
+            if alias not in q:
+                continue
             # find nearest number with optional comparator
-            pat = re.compile(rf"{re.escape(alias)}\s*(>=|<=|>|<|=)?\s*(\d+(?:\.\d+)?)")
             m = pat.search(q)
             if m:
                 comp = m.group(1) or '>='
@@ -128,7 +208,7 @@ def parse_query_for_epd(query: str) -> Dict[str, str]:
                 if comp in ('<', '<=', '='):
                     params[f'{key}_max'] = num
     # sort by
-    m = re.search(r"sort\s+by\s+([a-z\s$]+)", q)
+    m = _SORT_RE.search(q)
     if m:
         sort_token = m.group(1).strip()
         sort_key = SORT_FIELD_ALIASES.get(sort_token, SORT_FIELD_ALIASES.get(sort_token.replace(' ', ''), None))
@@ -136,7 +216,7 @@ def parse_query_for_epd(query: str) -> Dict[str, str]:
             # try known synonyms
             canonical = TRAIT_SYNONYMS.get(sort_token, None)
             if canonical:
-                base = canonical.lower().replace(' ', '_').replace('$', '')
+                base = _field_key(canonical)
                 sort_key = f'epd_{base}' if base in ['ww', 'yw', 'milk', 'bw'] else None
         if sort_key:
             params['sort_field'] = sort_key
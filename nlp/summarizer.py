@@ -1,17 +1,27 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from collections import Counter
+from operator import methodcaller
 
 
-def _top(counter: Counter, n: int = 5):
-    return ', '.join([f"{k}({v})" for k, v in counter.most_common(n)])
+def _top(counter: Counter, n: int = 5) -> str:
+    return ', '.join(f"{k}({v})" for k, v in counter.most_common(n))
+
+
+def _to_columnar(data: List[Dict[str, str]], *fields: str) -> Dict[str, List[Optional[str]]]:
+    # pivot the requested fields out of the row dicts once; map/methodcaller keep the loop in C
+    return {field: list(map(methodcaller('get', field), data)) for field in fields}
+
+
+def _count_fields(data: List[Dict[str, str]], *fields: str) -> List[Counter]:
+    # one Counter per field over its column; empty values are skipped
+    columns = _to_columnar(data, *fields)
+    return [Counter(filter(None, columns[field])) for field in fields]
 
 
 def summarize_ranch_results(data: List[Dict[str, str]]) -> str:
     if not data:
         return 'No data to summarize.'
-    states = Counter([row.get('state', '') for row in data if row.get('state')])
-    cities = Counter([row.get('city', '') for row in data if row.get('city')])
-    prefixes = Counter([row.get('herd_prefix', '') for row in data if row.get('herd_prefix')])
+    states, cities, prefixes = _count_fields(data, 'state', 'city', 'herd_prefix')
     out = []
     out.append(f"Total results: {len(data)}")
     if states:
@@ -26,8 +36,7 @@ def summarize_ranch_results(data: List[Dict[str, str]]) -> str:
 def summarize_epd_results(data: List[Dict[str, str]]) -> str:
     if not data:
         return 'No data to summarize.'
-    names = Counter([row.get('name', '') for row in data if row.get('name')])
-    regs = Counter([row.get('registration', '') for row in data if row.get('registration')])
+    names, regs = _count_fields(data, 'name', 'registration')
     out = []
     out.append(f"Total animals: {len(data)}")
     if names:
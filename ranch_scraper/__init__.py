@@ -6,5 +6,6 @@ from .form_parser import FormParser
 from .exporter import DynamicExporter
 from .interactive_prompt import InteractivePrompt
 from .form_handler import FormHandler
+from .browser import BrowserManager, PagePool, block_resources
 from .utils import normalize_string, clean_table_data, format_table_output, validate_search_params, generate_filename, sanitize_filename
-__all__ = ['DynamicScraper', 'FormParser', 'DynamicExporter', 'InteractivePrompt', 'FormHandler', 'normalize_string', 'clean_table_data', 'format_table_output', 'validate_search_params', 'generate_filename', 'sanitize_filename']
+__all__ = ['DynamicScraper', 'FormParser', 'DynamicExporter', 'InteractivePrompt', 'FormHandler', 'BrowserManager', 'PagePool', 'block_resources', 'normalize_string', 'clean_table_data', 'format_table_output', 'validate_search_params', 'generate_filename', 'sanitize_filename']
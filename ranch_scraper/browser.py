@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, List, Optional, Tuple, Union
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+
+logger = logging.getLogger(__name__)
+
+# Nothing the scrapers read depends on these, so skip fetching and rendering them
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+async def _filter_request(route: Route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def block_resources(page: Page) -> None:
+    await page.route('**/*', _filter_request)
+
+class BrowserManager:
+    """Process-wide Chromium instance shared by the menu, CLIs and scrapers."""
+    _lock: Optional[asyncio.Lock] = None
+    _browser: Optional[Browser] = None
+    _playwright: Any = None
+
+    @classmethod
+    async def get(cls) -> Tuple[Browser, Any]:
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        async with cls._lock:
+            if cls._browser is None or not cls._browser.is_connected():
+                if cls._playwright is not None:
+                    try:
+                        await cls._playwright.stop()
+                    except Exception:
+                        pass
+                cls._playwright = await async_playwright().start()
+                cls._browser = await cls._playwright.chromium.launch(headless=True)
+            return (cls._browser, cls._playwright)
+
+    @classmethod
+    async def close(cls) -> None:
+        browser, playwright = (cls._browser, cls._playwright)
+        cls._browser = None
+        cls._playwright = None
+        outcomes = await asyncio.gather(browser.close() if browser else asyncio.sleep(0), playwright.stop() if playwright else asyncio.sleep(0), return_exceptions=True)
+        for what, outcome in zip(('closing browser', 'stopping playwright'), outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning('Error %s: %s', what, outcome)
+
+class PagePool:
+    """Bounded set of reusable pages on one browser, opened lazily with resources blocked.
+
+    Given a BrowserContext instead, the pages share its HTTP cache, cookies and connections.
+    """
+
+    def __init__(self, browser: Union[Browser, BrowserContext], max_size: int=5):
+        self.browser = browser
+        self.max_size = max(1, max_size)
+        self._idle: Deque[Page] = deque()
+        self._pages: List[Page] = []
+        self._size = 0
+        # Guards _idle and _size; waiters are woken when a page is released or a slot frees up
+        self._slots = asyncio.Condition()
+
+    async def _open_page(self) -> Page:
+        page = await self.browser.new_page()
+        await block_resources(page)
+        self._pages.append(page)
+        return page
+
+    async def _free_slot(self) -> None:
+        async with self._slots:
+            self._size -= 1
+            # a waiter can now try opening a page of its own
+            self._slots.notify()
+
+    async def acquire(self) -> Page:
+        async with self._slots:
+            while not self._idle and self._size >= self.max_size:
+                await self._slots.wait()
+            if self._idle:
+                return self._idle.popleft()
+            # Claim the slot before opening so concurrent callers cannot overshoot max_size
+            self._size += 1
+        try:
+            return await self._open_page()
+        except BaseException:
+            await self._free_slot()
+            raise
+
+    async def release(self, page: Page) -> None:
+        if page.is_closed():
+            # Replace a page that died while in use so waiters in acquire() are not stranded
+            self._pages.remove(page)
+            try:
+                page = await self._open_page()
+            except Exception:
+                await self._free_slot()
+                return
+        async with self._slots:
+            self._idle.append(page)
+            self._slots.notify()
+
+    async def close(self) -> None:
+        pages, self._pages = (self._pages, [])
+        self._size = 0
+        self._idle = deque()
+        await asyncio.gather(*(page.close() for page in pages), return_exceptions=True)
@@ -1,23 +1,116 @@
 import argparse
 import asyncio
+import logging
+import os
+import re
 import sys
-from typing import Dict, List, Optional
-from playwright.async_api import Page
+from typing import Any, Dict, List, Optional, Tuple
+from playwright.async_api import BrowserContext, Page, Error as PlaywrightError
+from .browser import BrowserManager, PagePool, block_resources
 from .scraper import DynamicScraper
 from .exporter import DynamicExporter
-from .utils import validate_search_params, parse_location_input, sanitize_filename
+from .interactive_prompt import InteractivePrompt
+from .utils import validate_search_params, parse_location_input, sanitize_filename, parse_profile_table, ainput, uncancel_current_task, read_json_cache, write_json_cache
 
 # semantic imports
 from nlp.query_parser import classify_intent, parse_query_for_ranch
 from nlp.summarizer import summarize_ranch_results
 
+logger = logging.getLogger(__name__)
+
+_HREF_RE = re.compile(r'href="([^"]+)"')
+_MEMBER_ID_RE = re.compile(r'member_id=(\d+)')
+
+def _get_either(row: Dict[str, Any], key: str, fallback_key: str, default: Any='') -> Any:
+    # row.get(key, row.get(fallback_key, default)) without evaluating the fallback lookup on every hit
+    if key in row:
+        return row[key]
+    return row.get(fallback_key, default)
+
+# Site metadata (location list, form structure) changes rarely, so it is kept on disk between runs
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'ranch_scraper')
+METADATA_CACHE_TTL = 24 * 60 * 60
+# Bump when the shape of cached metadata changes so older files are ignored
+METADATA_CACHE_VERSION = 1
+
+# Clicks each profile tab in turn and parses its table in one round trip. A tab counts as loaded once
+# the AJAX container is replaced, so the previous tab's table is never re-read as this tab's.
+_MEMBER_TABS_JS = """
+    async () => {
+        const cellText = (cells) => Array.from(cells, (cell) => cell.textContent.trim());
+        const PARSERS = {
+            addresses: (c) => c.length >= 8 ? {type: c[0], street: c[1], city: c[2], state: c[3], postal_code: c[4], country: c[5], premise_id: c[6], email: c[7]} : null,
+            phones: (c) => c.length >= 6 ? {type: c[0], country_code: c[1], area_code: c[2], prefix: c[3], suffix: c[4], extension: c[5], full_number: `${c[1]}${c[2]}${c[3]}${c[4]}${c[5]}`.replace(/\\s+/g, '')} : null,
+            contacts: (c) => c.length >= 7 ? {job_title: c[1], name: c[2], nickname: c[3], email: c[4], phone: c[5], address: c[6]} : null
+        };
+        const TABS = [['addresses', 'tab-bg:2'], ['phones', 'tab-bg:3'], ['contacts', 'tab-bg:1']];
+        const loadTab = (tabId) => new Promise((resolve) => {
+            const tab = document.getElementById(tabId);
+            const container = document.getElementById('ajax_ranch_canvass');
+            if (!tab || !container) return resolve(null);
+            // the previous tab's table stays in the container until the new content replaces it
+            const before = container.querySelector('table');
+            const fresh = () => {
+                const table = container.querySelector('table');
+                return table !== before ? table : null;
+            };
+            const finish = (table) => { clearTimeout(timer); observer.disconnect(); resolve(table); };
+            // no table yet may just mean the AJAX is still in flight, so an empty tab is only given up on at the cap
+            const timer = setTimeout(() => finish(fresh()), 5000);
+            const observer = new MutationObserver(() => {
+                const table = fresh();
+                if (table) finish(table);
+            });
+            observer.observe(container, {childList: true, subtree: true});
+            tab.click();
+        });
+        const bundle = {};
+        for (const [key, tabId] of TABS) {
+            const table = await loadTab(tabId);
+            const rows = table ? Array.from(table.querySelectorAll('tr')).slice(1) : [];  // skip header row
+            bundle[key] = rows.map((row) => PARSERS[key](cellText(row.querySelectorAll('td')))).filter(Boolean);
+        }
+        return bundle;
+    }
+"""
+
 class RanchScraperCLI:
+    __slots__ = ('scraper', 'exporter', 'cache_dir', 'cache_ttl', 'refresh_metadata', 'concurrency', '_context')
+    # Built on first use and shared, so repeated CLI runs in one process skip re-declaring every option
+    _parser: Optional[argparse.ArgumentParser] = None
 
-    def __init__(self):
+    def __init__(self, concurrency: int=8, cache_dir: Optional[str]=DEFAULT_CACHE_DIR, cache_ttl: float=METADATA_CACHE_TTL):
         self.scraper = DynamicScraper()
         self.exporter = DynamicExporter()
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        self.refresh_metadata = False
+        # Member profiles fetched at once by "View all members detail"
+        self.concurrency = max(1, concurrency)
+        # One context on the shared browser for metadata and profile pages; a fresh page per operation
+        self._context: Optional[BrowserContext] = None
 
-    def parse_arguments(self) -> argparse.Namespace:
+    async def __aenter__(self) -> 'RanchScraperCLI':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.scraper.close()
+        await self._close_context()
+        await BrowserManager.close()
+
+    async def _close_context(self) -> None:
+        # Leaves the shared browser running, so the menu path can hand it to the next search
+        context, self._context = (self._context, None)
+        if context is not None:
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+    @classmethod
+    def build_parser(cls) -> argparse.ArgumentParser:
+        if cls._parser is not None:
+            return cls._parser
         parser = argparse.ArgumentParser(description='Dynamic Ranch Scraper for Digital Beef Shorthorn', formatter_class=argparse.RawDescriptionHelpFormatter, epilog='\nExamples:\n  python main.py --name "Red*" --city "Dallas" --location "Texas"\n  python main.py --prefix "ZZZ" --export csv\n  python main.py --location "TX" --output results.csv\n  python main.py --list-locations\n  python main.py (runs in interactive mode)\n        ')
         parser.add_argument('--name', help='Ranch name filter')
         parser.add_argument('--city', help='City filter')
@@ -26,14 +119,20 @@ class RanchScraperCLI:
         parser.add_argument('--location', help='Location filter (supports multiple formats)')
         parser.add_argument('--export', choices=['csv', 'json'], help='Export format')
         parser.add_argument('--output', help='Output filename')
+        parser.add_argument('--compress', choices=['gz'], help='Compress the export (gzip level 1; smaller files for a little CPU)')
         parser.add_argument('--list-locations', action='store_true', help='List available locations')
         parser.add_argument('--form-info', action='store_true', help='Show form structure information')
+        parser.add_argument('--refresh-locations', action='store_true', help='Ignore cached locations/form info and fetch them from the site')
         # semantic
         parser.add_argument('--semantic', action='store_true', help='Enable natural-language parsing')
         parser.add_argument('--query', help='Natural-language query for semantic parsing')
         parser.add_argument('--explain', action='store_true', help='Show parsed parameters before executing')
         parser.add_argument('--summary', action='store_true', help='Show summary of results after search')
-        return parser.parse_args()
+        cls._parser = parser
+        return parser
+
+    def parse_arguments(self) -> argparse.Namespace:
+        return self.build_parser().parse_args()
 
     def get_search_params_from_args(self, args: argparse.Namespace) -> Dict[str, str]:
         params = {}
@@ -56,19 +155,47 @@ class RanchScraperCLI:
             params = {**params, **semantic_params}
         return params
 
+    async def _shared_context(self) -> BrowserContext:
+        browser, _ = await BrowserManager.get()
+        if self._context is None or self._context.browser is not browser:
+            self._context = await browser.new_context()
+        return self._context
+
+    async def _open_page(self) -> Page:
+        page = await (await self._shared_context()).new_page()
+        await block_resources(page)
+        return page
+
+    def _read_metadata_cache(self, name: str) -> Optional[Any]:
+        if not self.cache_dir or self.refresh_metadata:
+            return None
+        return read_json_cache(os.path.join(self.cache_dir, name), self.cache_ttl, version=METADATA_CACHE_VERSION, base_url=self.scraper.base_url)
+
+    def _write_metadata_cache(self, name: str, data: Any) -> None:
+        if not self.cache_dir or not data:
+            return
+        try:
+            write_json_cache(os.path.join(self.cache_dir, name), data, version=METADATA_CACHE_VERSION, base_url=self.scraper.base_url)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning('Could not write %s cache: %s', name, e)
+
     async def get_available_locations(self) -> List[Dict[str, str]]:
+        cached = self._read_metadata_cache('locations.json')
+        if cached is not None:
+            return cached
         try:
-            browser, playwright = await self.scraper.init_browser()
-            page = await browser.new_page()
-            await self.scraper.navigate_to_site(page)
-            await self.scraper.wait_for_form_ready(page)
-            locations = await self.scraper.get_available_locations(page)
-            await browser.close()
-            await playwright.stop()
-            return locations
+            page = await self._open_page()
+            try:
+                await self.scraper.navigate_to_site(page)
+                await self.scraper.wait_for_form_ready(page)
+                locations = await self.scraper.get_available_locations(page)
+            finally:
+                await page.close()
         except Exception as e:
             print(f'Error getting locations: {e}')
             return []
+        self._write_metadata_cache('locations.json', locations)
+        return locations
 
     async def list_locations(self):
         print('Fetching available locations...')
@@ -89,11 +216,14 @@ class RanchScraperCLI:
     async def show_form_info(self):
         print('Fetching form information...')
         try:
-            browser, playwright = await self.scraper.init_browser()
-            page = await browser.new_page()
-            form_info = await self.scraper.get_form_info(page)
-            await browser.close()
-            await playwright.stop()
+            form_info = self._read_metadata_cache('form_info.json')
+            if form_info is None:
+                page = await self._open_page()
+                try:
+                    form_info = await self.scraper.get_form_info(page)
+                finally:
+                    await page.close()
+                self._write_metadata_cache('form_info.json', form_info)
             if form_info:
                 print('\nForm Structure Information:')
                 print('=' * 40)
@@ -120,7 +250,14 @@ class RanchScraperCLI:
         except Exception as e:
             print(f'Error getting form info: {e}')
 
-    async def run_scraper(self, search_params: Dict[str, str], export_format: Optional[str]=None, output_filename: Optional[str]=None, show_summary: bool=False, explain: bool=False):
+    def _print_results(self, results: List[Dict[str, str]]) -> None:
+        # Write the table as-is rather than building '\n' + table just to print it
+        out = sys.stdout
+        out.write('\n')
+        out.write(self.scraper.format_results(results))
+        out.write('\n')
+
+    async def run_scraper(self, search_params: Dict[str, str], export_format: Optional[str]=None, output_filename: Optional[str]=None, show_summary: bool=False, explain: bool=False, compress: Optional[str]=None):
         if explain:
             print('\nParsed parameters:')
             for k, v in search_params.items():
@@ -130,20 +267,21 @@ class RanchScraperCLI:
         if not results:
             print('No results found')
             return
-        print('\n' + self.scraper.format_results(results))
+        self._print_results(results)
         if show_summary:
             print('\nSummary:')
             print(summarize_ranch_results(results))
         if export_format:
             if output_filename:
-                exported_file = self.exporter.export_data(results, export_format, output_filename)
+                exported_file = self.exporter.export_data(results, export_format, output_filename, compress)
             else:
-                exported_file = self.exporter.export_data(results, export_format)
+                exported_file = self.exporter.export_data(results, export_format, compress=compress)
             if exported_file:
                 print(f'Results exported to: {exported_file}')
 
     async def main(self):
         args = self.parse_arguments()
+        self.refresh_metadata = args.refresh_locations
         if args.list_locations:
             await self.list_locations()
             return
@@ -159,14 +297,13 @@ class RanchScraperCLI:
             print('\nUse --help for usage information')
             print('Run without arguments for interactive mode')
             sys.exit(1)
-        await self.run_scraper(search_params, args.export, args.output, show_summary=args.summary, explain=args.explain)
+        await self.run_scraper(search_params, args.export, args.output, show_summary=args.summary, explain=args.explain, compress=args.compress)
 
     async def main_with_page(self, page: Page):
         try:
             if not await self.scraper.wait_for_form_ready(page):
                 print('Failed to load search form')
                 return
-            from .interactive_prompt import InteractivePrompt
             interactive_prompt = InteractivePrompt()
             params, export_format, filename = await interactive_prompt.run_interactive_mode(page)
             if not params:
@@ -176,10 +313,13 @@ class RanchScraperCLI:
             if not results:
                 print('No results found')
                 return
-            print('\n' + self.scraper.format_results(results))
+            self._print_results(results)
             await self._show_follow_up_menu(results, page)
         except Exception as e:
             print(f'Error in ranch scraper: {e}')
+        finally:
+            await self.scraper.close()
+            await self._close_context()
 
     async def _show_follow_up_menu(self, data: List[Dict[str, str]], page: Page):
         while True:
@@ -190,16 +330,16 @@ class RanchScraperCLI:
             print('4. New search')
             print('5. Return to main menu')
             try:
-                choice = input('\nEnter your choice (1-5): ').strip()
+                choice = (await ainput('\nEnter your choice (1-5): ')).strip()
                 if choice == '1':
-                    filename = input("Enter CSV filename (or press Enter for 'ranch_results.csv'): ").strip()
+                    filename = (await ainput("Enter CSV filename (or press Enter for 'ranch_results.csv'): ")).strip()
                     if not filename:
                         filename = 'ranch_results.csv'
                     exported_file = self.exporter.export_to_csv(data, filename)
                     if exported_file:
                         print(f'Results exported to: {exported_file}')
                 elif choice == '2':
-                    filename = input("Enter JSON filename (or press Enter for 'ranch_results.json'): ").strip()
+                    filename = (await ainput("Enter JSON filename (or press Enter for 'ranch_results.json'): ")).strip()
                     if not filename:
                         filename = 'ranch_results.json'
                     exported_file = self.exporter.export_to_json(data, filename)
@@ -209,9 +349,8 @@ class RanchScraperCLI:
                     updated = await self._view_member_detail(data, page)
                     if isinstance(updated, list) and updated:
                         data = updated
-                        print('\n' + self.scraper.format_results(data))
+                        self._print_results(data)
                 elif choice == '4':
-                    from .interactive_prompt import InteractivePrompt
                     interactive_prompt = InteractivePrompt()
                     params, _, _ = await interactive_prompt.run_interactive_mode(page)
                     if not params:
@@ -222,13 +361,14 @@ class RanchScraperCLI:
                         print('No results found')
                         continue
                     data = new_results
-                    print('\n' + self.scraper.format_results(data))
+                    self._print_results(data)
                 elif choice == '5':
                     print('Returning to main menu...')
                     break
                 else:
                     print('Invalid choice. Please enter 1, 2, 3, 4, or 5.')
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                uncancel_current_task()
                 print('\nOperation cancelled.')
                 break
             except Exception as e:
@@ -241,8 +381,8 @@ class RanchScraperCLI:
             return data
         print(f'\nAvailable members ({len(data)} total):')
         for i, member in enumerate(data, 1):
-            member_id = member.get('member_id', member.get('Member ID', 'Unknown'))
-            member_name = member.get('member_name', member.get('Member Name', 'Unknown'))
+            member_id = _get_either(member, 'member_id', 'Member ID', 'Unknown')
+            member_name = _get_either(member, 'member_name', 'Member Name', 'Unknown')
             print(f'{i}. {member_id} - {member_name}')
         print(f'\nView options:')
         print('1. View one member detail')
@@ -250,7 +390,7 @@ class RanchScraperCLI:
         print('3. Cancel')
         while True:
             try:
-                choice = input(f'\nEnter your choice (1-3): ').strip()
+                choice = (await ainput(f'\nEnter your choice (1-3): ')).strip()
                 if choice == '1':
                     return await self._view_single_member_detail(data, page)
                 elif choice == '2':
@@ -260,7 +400,8 @@ class RanchScraperCLI:
                     return data
                 else:
                     print('Invalid choice. Please enter 1, 2, or 3.')
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                uncancel_current_task()
                 print('\nOperation cancelled.')
                 return data
             except Exception as e:
@@ -275,82 +416,57 @@ class RanchScraperCLI:
         print(f"DBA: {member.get('dba', 'N/A')}")
         print(f"City: {member.get('city', 'N/A')}")
         print(f"State: {member.get('state', 'N/A')}")
-        member_id_html = member.get('member_id_html', member.get('member_id', ''))
+        member_id_html = _get_either(member, 'member_id_html', 'member_id')
         if not member_id_html:
             print('No member ID found for detail view.')
             return None
-        if '<a href=' in member_id_html:
-            import re
-            url_match = re.search('href="([^"]+)"', member_id_html)
-            if url_match:
-                profile_url = url_match.group(1).replace('&amp;', '&')
-                print(f'\nFetching detailed profile information...')
-                try:
-                    await page.goto(profile_url, wait_until='networkidle', timeout=15000)
-                    from .utils import parse_profile_table
-                    profile_details = await parse_profile_table(page)
-                    # Also enrich with addresses/phones/contacts
-                    member_id_match = re.search('member_id=(\d+)', profile_url)
-                    addresses = []
-                    phones = []
-                    contacts = []
-                    if member_id_match:
-                        member_id_num = member_id_match.group(1)
-                        addresses = await self._get_addresses(page, member_id_num)
-                        phones = await self._get_phones(page, member_id_num)
-                        contacts = await self._get_contacts(page, member_id_num)
-                    enriched_member = member.copy()
-                    enriched_member.update(profile_details)
-                    enriched_member['addresses'] = addresses
-                    enriched_member['phones'] = phones
-                    enriched_member['contacts'] = contacts
-                    if 'member_id_html' in enriched_member:
-                        del enriched_member['member_id_html']
-                    return enriched_member
-                except Exception as e:
-                    print(f'Error fetching profile details: {e}')
-                    return None
-            else:
-                print('Could not extract profile URL.')
-                return None
-        else:
+        url_match = _HREF_RE.search(member_id_html)
+        if url_match is None:
             print('No profile link found for this member.')
             return None
-
-    async def _get_addresses(self, page, member_id):
+        profile_url = url_match.group(1).replace('&amp;', '&')
+        print(f'\nFetching detailed profile information...')
         try:
-            await page.click('#tab-bg\\:2')
-            await page.wait_for_selector('#ajax_ranch_canvass table', timeout=10000)
-            addresses = await page.evaluate("\n                () => {\n                    const table = document.querySelector('#ajax_ranch_canvass table');\n                    if (!table) return [];\n                    \n                    const rows = table.querySelectorAll('tr');\n                    const addresses = [];\n                    \n                    for (let i = 1; i < rows.length; i++) { // Skip header row\n                        const cells = rows[i].querySelectorAll('td');\n                        if (cells.length >= 8) {\n                            const address = {\n                                type: cells[0].textContent.trim(),\n                                street: cells[1].textContent.trim(),\n                                city: cells[2].textContent.trim(),\n                                state: cells[3].textContent.trim(),\n                                postal_code: cells[4].textContent.trim(),\n                                country: cells[5].textContent.trim(),\n                                premise_id: cells[6].textContent.trim(),\n                                email: cells[7].textContent.trim()\n                            };\n                            addresses.push(address);\n                        }\n                    }\n                    \n                    return addresses;\n                }\n            ")
-            return addresses
+            await self._goto_with_retry(page, profile_url)
+            profile_details = await parse_profile_table(page)
+            # Also enrich with addresses/phones/contacts
+            member_id_match = _MEMBER_ID_RE.search(profile_url)
+            addresses = []
+            phones = []
+            contacts = []
+            if member_id_match:
+                bundle = await self._get_tabs_bundle(page)
+                addresses = bundle['addresses']
+                phones = bundle['phones']
+                contacts = bundle['contacts']
+            enriched_member = {**member, **profile_details, 'addresses': addresses, 'phones': phones, 'contacts': contacts}
+            enriched_member.pop('member_id_html', None)
+            return enriched_member
         except Exception as e:
-            print(f'Error getting addresses: {e}')
-            return []
+            print(f'Error fetching profile details: {e}')
+            return None
 
-    async def _get_phones(self, page, member_id):
-        try:
-            await page.click('#tab-bg\\:3')
-            await page.wait_for_selector('#ajax_ranch_canvass table', timeout=10000)
-            phones = await page.evaluate("\n                () => {\n                    const table = document.querySelector('#ajax_ranch_canvass table');\n                    if (!table) return [];\n                    \n                    const rows = table.querySelectorAll('tr');\n                    const phones = [];\n                    \n                    for (let i = 1; i < rows.length; i++) { // Skip header row\n                        const cells = rows[i].querySelectorAll('td');\n                        if (cells.length >= 6) {\n                            const countryCode = cells[1].textContent.trim();\n                            const areaCode = cells[2].textContent.trim();\n                            const prefix = cells[3].textContent.trim();\n                            const suffix = cells[4].textContent.trim();\n                            const extension = cells[5].textContent.trim();\n                            \n                            const phone = {\n                                type: cells[0].textContent.trim(),\n                                country_code: countryCode,\n                                area_code: areaCode,\n                                prefix: prefix,\n                                suffix: suffix,\n                                extension: extension,\n                                full_number: `${countryCode}${areaCode}${prefix}${suffix}${extension}`.replace(/\\s+/g, '')\n                            };\n                            phones.push(phone);\n                        }\n                    }\n                    \n                    return phones;\n                }\n            ")
-            return phones
-        except Exception as e:
-            print(f'Error getting phones: {e}')
-            return []
+    async def _goto_with_retry(self, page: Page, url: str, tries: int=3, base: float=1.0):
+        # Retry transient network errors and timeouts, backing off 1s, 2s, ... between attempts
+        for attempt in range(tries):
+            try:
+                return await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+            except PlaywrightError:
+                if attempt == tries - 1:
+                    raise
+                await asyncio.sleep(base * 2 ** attempt)
 
-    async def _get_contacts(self, page, member_id):
+    async def _get_tabs_bundle(self, page: Page) -> Dict[str, List[Dict[str, str]]]:
         try:
-            await page.click('#tab-bg\\:1')
-            await page.wait_for_selector('#ajax_ranch_canvass table', timeout=10000)
-            contacts = await page.evaluate("\n                () => {\n                    const table = document.querySelector('#ajax_ranch_canvass table');\n                    if (!table) return [];\n                    \n                    const rows = table.querySelectorAll('tr');\n                    const contacts = [];\n                    \n                    for (let i = 1; i < rows.length; i++) { // Skip header row\n                        const cells = rows[i].querySelectorAll('td');\n                        if (cells.length >= 7) {\n                            const contact = {\n                                job_title: cells[1].textContent.trim(),\n                                name: cells[2].textContent.trim(),\n                                nickname: cells[3].textContent.trim(),\n                                email: cells[4].textContent.trim(),\n                                phone: cells[5].textContent.trim(),\n                                address: cells[6].textContent.trim()\n                            };\n                            contacts.push(contact);\n                        }\n                    }\n                    \n                    return contacts;\n                }\n            ")
-            return contacts
+            return await page.evaluate(_MEMBER_TABS_JS)
         except Exception as e:
-            print(f'Error getting contacts: {e}')
-            return []
+            print(f'Error getting addresses/phones/contacts: {e}')
+            return {'addresses': [], 'phones': [], 'contacts': []}
 
     async def _view_single_member_detail(self, data: List[Dict[str, str]], page: Page) -> List[Dict[str, str]]:
         while True:
             try:
-                choice = input(f"\nEnter member number (1-{len(data)}) or 'q' to quit: ").strip()
+                choice = (await ainput(f"\nEnter member number (1-{len(data)}) or 'q' to quit: ")).strip()
                 if choice.lower() == 'q':
                     print('Cancelled.')
                     return data
@@ -360,79 +476,106 @@ class RanchScraperCLI:
                         selected_member = data[member_index]
                         enriched = await self._show_member_detail(selected_member, page)
                         if enriched:
-                            new_data = data.copy()
-                            new_data[member_index] = enriched
-                            return new_data
+                            # the follow-up menu rebinds data to the return value, so update the row in place
+                            data[member_index] = enriched
                         return data
                     else:
                         print(f'Invalid choice. Please enter a number between 1 and {len(data)}.')
                 except ValueError:
                     print("Invalid input. Please enter a number or 'q' to quit.")
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, asyncio.CancelledError):
+                uncancel_current_task()
                 print('\nOperation cancelled.')
                 return data
             except Exception as e:
                 print(f'Error: {e}')
                 return data
 
+    async def _fetch_profile(self, profile_url: str, pool: PagePool) -> Dict[str, Any]:
+        page = await pool.acquire()
+        try:
+            await self._goto_with_retry(page, profile_url)
+            profile_details = await parse_profile_table(page)
+            if _MEMBER_ID_RE.search(profile_url):
+                profile_details.update(await self._get_tabs_bundle(page))
+            return profile_details
+        finally:
+            await pool.release(page)
+
+    async def _enrich_one(self, i: int, total: int, member: Dict[str, str], pool: PagePool, fetched: Dict[str, asyncio.Future]) -> Tuple[Dict[str, str], List[str], bool]:
+        # Progress lines are returned rather than printed so concurrent members do not interleave; the flag
+        # is False when the member was skipped or its profile could not be loaded
+        lines = [f"\nProcessing member {i}/{total}: {member.get('member_id', 'Unknown')}"]
+        member_id_html = _get_either(member, 'member_id_html', 'member_id')
+        if not member_id_html:
+            lines.append(f'  Skipping: No member ID found')
+            return (member, lines, False)
+        url_match = _HREF_RE.search(member_id_html)
+        if url_match is None:
+            lines.append(f'  Skipping: No profile link found')
+            return (member, lines, False)
+        profile_url = url_match.group(1).replace('&amp;', '&')
+        member_id_match = _MEMBER_ID_RE.search(profile_url)
+        key = member_id_match.group(1) if member_id_match else profile_url
+        # A ranch listed under several herd prefixes links to one profile; later rows await the first fetch
+        # (even while it is still in flight) instead of loading the page again
+        duplicate = key in fetched
+        if not duplicate:
+            fetched[key] = asyncio.ensure_future(self._fetch_profile(profile_url, pool))
+        try:
+            profile_details = await fetched[key]
+            enriched_member = {**member, **profile_details}
+            enriched_member.pop('member_id_html', None)
+            if duplicate:
+                lines.append(f'  (profile already fetched for another row)')
+            lines.append(f"  ✓ Enriched: {profile_details.get('breeder_type', 'N/A')} - {profile_details.get('profile_type', 'N/A')}")
+            if profile_details.get('addresses'):
+                lines.append(f"    Addresses: {len(profile_details.get('addresses', []))} found")
+            if profile_details.get('phones'):
+                lines.append(f"    Phones: {len(profile_details.get('phones', []))} found")
+            if profile_details.get('contacts'):
+                lines.append(f"    Contacts: {len(profile_details.get('contacts', []))} found")
+            return (enriched_member, lines, True)
+        except Exception as e:
+            lines.append(f'  ✗ Error: {e}')
+            enriched_member = {**member, 'breeder_type': '', 'profile_type': '', 'profile_id': '', 'profile_name': '', 'dba': '', 'herd_prefix': '', 'addresses': [], 'phones': [], 'contacts': []}
+            return (enriched_member, lines, False)
+
     async def _view_all_members_detail(self, data, page) -> List[Dict[str, str]]:
         print(f'\nFetching details for all {len(data)} members...')
-        enriched_results = []
-        for i, member in enumerate(data, 1):
-            print(f"\nProcessing member {i}/{len(data)}: {member.get('member_id', 'Unknown')}")
-            member_id_html = member.get('member_id_html', member.get('member_id', ''))
-            if not member_id_html:
-                print(f'  Skipping: No member ID found')
-                enriched_results.append(member)
-                continue
-            if '<a href=' in member_id_html:
-                import re
-                url_match = re.search('href="([^"]+)"', member_id_html)
-                if url_match:
-                    profile_url = url_match.group(1).replace('&amp;', '&')
-                    try:
-                        await page.goto(profile_url, wait_until='networkidle', timeout=15000)
-                        from .utils import parse_profile_table
-                        profile_details = await parse_profile_table(page)
-                        import re
-                        member_id_match = re.search('member_id=(\\d+)', profile_url)
-                        if member_id_match:
-                            member_id_num = member_id_match.group(1)
-                            addresses = await self._get_addresses(page, member_id_num)
-                            phones = await self._get_phones(page, member_id_num)
-                            contacts = await self._get_contacts(page, member_id_num)
-                            profile_details['addresses'] = addresses
-                            profile_details['phones'] = phones
-                            profile_details['contacts'] = contacts
-                        enriched_member = member.copy()
-                        enriched_member.update(profile_details)
-                        if 'member_id_html' in enriched_member:
-                            del enriched_member['member_id_html']
-                        enriched_results.append(enriched_member)
-                        print(f"  ✓ Enriched: {profile_details.get('breeder_type', 'N/A')} - {profile_details.get('profile_type', 'N/A')}")
-                        if profile_details.get('addresses'):
-                            print(f"    Addresses: {len(profile_details.get('addresses', []))} found")
-                        if profile_details.get('phones'):
-                            print(f"    Phones: {len(profile_details.get('phones', []))} found")
-                        if profile_details.get('contacts'):
-                            print(f"    Contacts: {len(profile_details.get('contacts', []))} found")
-                    except Exception as e:
-                        print(f'  ✗ Error: {e}')
-                        enriched_member = member.copy()
-                        enriched_member.update({'breeder_type': '', 'profile_type': '', 'profile_id': '', 'profile_name': '', 'dba': '', 'herd_prefix': '', 'addresses': [], 'phones': [], 'contacts': []})
-                        enriched_results.append(enriched_member)
-                else:
-                    print(f'  Skipping: Could not extract profile URL')
-                    enriched_results.append(member)
+        # Profiles load on their own pages so the search page stays usable for the follow-up menu; the pages
+        # share one context, so scripts fetched for the first profile are served from its HTTP cache afterwards
+        pool = PagePool(await self._shared_context(), max_size=min(self.concurrency, len(data)))
+        fetched: Dict[str, asyncio.Future] = {}
+        total = len(data)
+        # Per-member detail is only logged with -v/--verbose; otherwise one progress line is redrawn in place
+        verbose = logger.isEnabledFor(logging.INFO)
+        done = 0
+
+        async def enrich_and_report(i: int, member: Dict[str, str]) -> Dict[str, str]:
+            nonlocal done
+            enriched_member, lines, ok = await self._enrich_one(i, total, member, pool, fetched)
+            done += 1
+            if verbose:
+                logger.info('\n'.join(lines))
             else:
-                print(f'  Skipping: No profile link found')
-                enriched_results.append(member)
+                # skips and errors stay visible above the progress line
+                report = '\r' + '\n'.join(lines).lstrip('\n') + '\n' if not ok else '\r'
+                sys.stdout.write(f'{report}Enriching members: {done}/{total}')
+                sys.stdout.flush()
+            return enriched_member
+        try:
+            # gather keeps input order even though members finish out of order
+            enriched_results = await asyncio.gather(*[enrich_and_report(i, member) for i, member in enumerate(data, 1)])
+        finally:
+            await pool.close()
+        enriched_results = list(enriched_results)
         print(f'\nEnrichment complete. {len(enriched_results)} results processed.')
-        print('\n' + self.scraper.format_results(enriched_results))
+        self._print_results(enriched_results)
         return enriched_results
 
 async def main():
-    cli = RanchScraperCLI()
-    await cli.main()
+    async with RanchScraperCLI() as cli:
+        await cli.main()
 if __name__ == '__main__':
     asyncio.run(main())
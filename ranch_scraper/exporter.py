@@ -1,74 +1,184 @@
 import csv
+import gzip
+import io
 import json
 import os
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, IO, Optional, Sequence, Tuple
 from datetime import datetime
 from .utils import generate_filename, sanitize_filename, clean_table_data
 
+# a 1 MiB buffer lets large exports reach the OS in a few big writes
+EXPORT_WRITE_BUFFER = 1 << 20
+# gzip level 1 gets most of the size reduction on text-heavy exports for a fraction of the CPU of level 9;
+# worth it when disk or network bandwidth, not CPU, bounds the export
+COMPRESSIONS = ('gz',)
+GZIP_LEVEL = 1
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+def _dumps(obj: Any) -> bytes:
+    if HAVE_ORJSON:
+        # orjson encodes straight to UTF-8 bytes, skipping json's per-value Python dispatch
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    # one dumps() call instead of json.dump's many small writes
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _plain_csv(fieldnames: List[str], rows: Sequence[Tuple[str, ...]]) -> Optional[str]:
+    """Join rows as CSV text without the csv module, or return None if any field would need quoting."""
+    if len(fieldnames) < 2:
+        # csv quotes an empty field when it is the only one on its line
+        return None
+    lines = [','.join(fieldnames)]
+    lines.extend(map(','.join, rows))
+    text = '\r\n'.join(lines)
+    # Every comma and line break must be one this join put there; any extra, or a quote, means a field needs quoting
+    if '"' in text or text.count(',') != len(lines) * (len(fieldnames) - 1) or text.count('\n') != len(lines) - 1 or text.count('\r') != len(lines) - 1:
+        return None
+    return text + '\r\n'
+
+@lru_cache(maxsize=256)
+def _sanitized_filename(filename: str, extension: str) -> str:
+    filename = sanitize_filename(filename)
+    if not filename.endswith(f'.{extension}'):
+        filename += f'.{extension}'
+    return filename
+
+def _export_filename(filename: Optional[str], extension: str, compress: Optional[str]=None) -> str:
+    if compress and filename and filename.endswith(f'.{compress}'):
+        # 'results.csv.gz' names the compressed file, not a '.gz' stem
+        filename = filename[:-len(compress) - 1]
+    if not filename:
+        # timestamped, so never cached
+        filename = generate_filename('ranch_results', extension)
+    else:
+        filename = _sanitized_filename(filename, extension)
+    return f'{filename}.{compress}' if compress else filename
+
+@contextmanager
+def _atomic_open(path: str, mode: str='wb', compress: Optional[str]=None, **kwargs: Any) -> Iterator[IO]:
+    # Written beside the target and renamed into place, so a failed export never leaves a partial file
+    tmp_path = f'{path}.tmp'
+    try:
+        with ExitStack() as stack:
+            f = stack.enter_context(open(tmp_path, 'wb', buffering=EXPORT_WRITE_BUFFER))
+            if compress == 'gz':
+                # named after the target so the gzip header does not record the temp file
+                f = stack.enter_context(gzip.GzipFile(filename=os.path.basename(path), mode='wb', compresslevel=GZIP_LEVEL, fileobj=f))
+            if 'b' not in mode:
+                f = stack.enter_context(io.TextIOWrapper(f, **kwargs))
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _write_streamed(f: IO, obj: Any, indent: bytes, top: bool) -> None:
+    # Lists are written an item at a time, and so is a top-level dict with string keys, so only one row's
+    # bytes are held at once. Each piece is re-indented to its depth, matching a whole-object indent=2 dump;
+    # JSON strings never contain a raw newline.
+    inner = indent + b'  '
+    if isinstance(obj, list) and obj:
+        f.write(b'[')
+        for i, item in enumerate(obj):
+            f.write((b',\n' if i else b'\n') + inner)
+            f.write(_dumps(item).replace(b'\n', b'\n' + inner))
+        f.write(b'\n' + indent + b']')
+    elif top and isinstance(obj, dict) and obj and all((isinstance(key, str) for key in obj)):
+        f.write(b'{')
+        for i, (key, value) in enumerate(obj.items()):
+            f.write((b',\n' if i else b'\n') + inner + _dumps(key) + b': ')
+            _write_streamed(f, value, inner, False)
+        f.write(b'\n' + indent + b'}')
+    else:
+        f.write(_dumps(obj).replace(b'\n', b'\n' + indent))
+
+def _write_json(obj: Any, filename: str, compress: Optional[str]=None) -> None:
+    with _atomic_open(filename, compress=compress) as f:
+        _write_streamed(f, obj, b'', True)
+
+def _build_metadata(data: List[Dict[str, Any]], source: str='ranch_scraper') -> Dict[str, Any]:
+    return {'export_timestamp': datetime.now().isoformat(), 'total_records': len(data), 'columns': list(data[0].keys()) if data else [], 'source': source}
+
 class DynamicExporter:
 
     def __init__(self):
         self.supported_formats = ['csv', 'json']
+        # format name (lower-case) -> handler, so each entry point lower-cases once and makes one lookup
+        self._exporters = {'csv': self.export_to_csv, 'json': self.export_to_json}
+        self._previewers = {'csv': self._preview_csv, 'json': self._preview_json}
 
-    def export_to_csv(self, data: List[Dict[str, Any]], filename: Optional[str]=None) -> str:
+    def export_to_csv(self, data: List[Dict[str, Any]], filename: Optional[str]=None, compress: Optional[str]=None) -> str:
         if not data:
             print('No data to export')
             return ''
+        if not self._check_compression(compress):
+            return ''
         cleaned_data = clean_table_data(data)
-        if not filename:
-            filename = generate_filename('ranch_results', 'csv')
-        else:
-            filename = sanitize_filename(filename)
-            if not filename.endswith('.csv'):
-                filename += '.csv'
+        filename = _export_filename(filename, 'csv', compress)
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                if cleaned_data:
-                    fieldnames = list(cleaned_data[0].keys())
+            with _atomic_open(filename, 'w', compress, newline='', encoding='utf-8') as csvfile:
+                # Every key any row has, in first-seen order, so columns that only later rows carry (such as
+                # profile details after a skipped member) are kept rather than rejected
+                fieldnames = list(dict.fromkeys(chain.from_iterable(cleaned_data)))
+                # Rows holding every field (the usual case) are read by one C-level itemgetter call
+                width = len(fieldnames)
+                # itemgetter returns a bare value for one key, and needs at least one
+                get = itemgetter(*fieldnames) if width > 1 else lambda row: tuple((row[field] for field in fieldnames))
+                rows = [get(row) if len(row) == width else tuple((row.get(field, '') for field in fieldnames)) for row in cleaned_data]
+                text = _plain_csv(fieldnames, rows)
+                if text is not None:
+                    csvfile.write(text)
                 else:
-                    fieldnames = []
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                for row in cleaned_data:
-                    writer.writerow(row)
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    writer.writerows(rows)
             print(f'Results exported to {filename}')
             return filename
         except Exception as e:
             print(f'Error exporting to CSV: {e}')
             return ''
 
-    def export_to_json(self, data: List[Dict[str, Any]], filename: Optional[str]=None) -> str:
+    def export_to_json(self, data: List[Dict[str, Any]], filename: Optional[str]=None, compress: Optional[str]=None) -> str:
         if not data:
             print('No data to export')
             return ''
+        if not self._check_compression(compress):
+            return ''
         cleaned_data = clean_table_data(data)
-        if not filename:
-            filename = generate_filename('ranch_results', 'json')
-        else:
-            filename = sanitize_filename(filename)
-            if not filename.endswith('.json'):
-                filename += '.json'
+        filename = _export_filename(filename, 'json', compress)
         try:
-            with open(filename, 'w', encoding='utf-8') as jsonfile:
-                json.dump(cleaned_data, jsonfile, indent=2, ensure_ascii=False)
+            _write_json(cleaned_data, filename, compress)
             print(f'Results exported to {filename}')
             return filename
         except Exception as e:
             print(f'Error exporting to JSON: {e}')
             return ''
 
-    def export_data(self, data: List[Dict[str, Any]], format_type: str, filename: Optional[str]=None) -> str:
+    def _check_compression(self, compress: Optional[str]) -> bool:
+        if compress is None or compress in COMPRESSIONS:
+            return True
+        print(f'Unsupported compression: {compress}. Supported: {list(COMPRESSIONS)}')
+        return False
+
+    def export_data(self, data: List[Dict[str, Any]], format_type: str, filename: Optional[str]=None, compress: Optional[str]=None) -> str:
         format_type = format_type.lower()
-        if format_type not in self.supported_formats:
+        export = self._exporters.get(format_type)
+        if export is None:
             print(f'Unsupported format: {format_type}. Supported formats: {self.supported_formats}')
             return ''
-        if format_type == 'csv':
-            return self.export_to_csv(data, filename)
-        elif format_type == 'json':
-            return self.export_to_json(data, filename)
-        else:
-            print(f'Unknown format: {format_type}')
-            return ''
+        return export(data, filename, compress)
 
     def get_export_info(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not data:
@@ -76,23 +186,34 @@ class DynamicExporter:
         columns = list(data[0].keys()) if data else []
         column_types = {}
         for col in columns:
-            values = [row.get(col, '') for row in data]
-            non_empty = [v for v in values if v]
-            if non_empty:
-                try:
-                    [float(v) for v in non_empty]
-                    column_types[col] = 'numeric'
-                except ValueError:
-                    if all((len(str(v)) <= 10 for v in non_empty)):
-                        column_types[col] = 'code'
-                    else:
-                        column_types[col] = 'text'
-            else:
+            has_value = False
+            numeric = True
+            short = True
+            for row in data:
+                v = row.get(col, '')
+                if not v:
+                    continue
+                has_value = True
+                if numeric:
+                    try:
+                        float(v)
+                    except ValueError:
+                        numeric = False
+                if short and len(v if isinstance(v, str) else str(v)) > 10:
+                    short = False
+                if not numeric and not short:
+                    # settled as text; the remaining rows cannot change it
+                    break
+            if not has_value:
                 column_types[col] = 'empty'
+            elif numeric:
+                column_types[col] = 'numeric'
+            else:
+                column_types[col] = 'code' if short else 'text'
         return {'row_count': len(data), 'columns': columns, 'column_types': column_types, 'sample_data': data[0] if data else {}, 'exportable': True}
 
     def validate_export_format(self, format_type: str) -> bool:
-        return format_type.lower() in self.supported_formats
+        return format_type.lower() in self._exporters
 
     def get_supported_formats(self) -> List[str]:
         return self.supported_formats.copy()
@@ -100,13 +221,10 @@ class DynamicExporter:
     def preview_export(self, data: List[Dict[str, Any]], format_type: str, max_rows: int=5) -> str:
         if not data:
             return 'No data to preview'
-        preview_data = data[:max_rows]
-        if format_type.lower() == 'csv':
-            return self._preview_csv(preview_data)
-        elif format_type.lower() == 'json':
-            return self._preview_json(preview_data)
-        else:
+        preview = self._previewers.get(format_type.lower())
+        if preview is None:
             return f'Unsupported format: {format_type}'
+        return preview(data[:max_rows])
 
     def _preview_csv(self, data: List[Dict[str, Any]]) -> str:
         if not data:
@@ -114,43 +232,51 @@ class DynamicExporter:
         lines = []
         headers = list(data[0].keys())
         lines.append(','.join(headers))
+        blanks = [''] * len(headers)
         for row in data:
-            values = [str(row.get(h, '')) for h in headers]
+            # map over row.get with '' defaults; str() only runs on the non-string cells
+            values = [v if isinstance(v, str) else str(v) for v in map(row.get, headers, blanks)]
             lines.append(','.join(values))
         return '\n'.join(lines)
 
     def _preview_json(self, data: List[Dict[str, Any]]) -> str:
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return _dumps(data).decode('utf-8')
 
     def export_with_metadata(self, data: List[Dict[str, Any]], format_type: str, filename: Optional[str]=None) -> str:
         if not data:
             print('No data to export')
             return ''
-        metadata = {'export_timestamp': datetime.now().isoformat(), 'total_records': len(data), 'columns': list(data[0].keys()) if data else [], 'source': 'ranch_scraper'}
-        if format_type.lower() == 'json':
+        metadata = _build_metadata(data)
+        format_type = format_type.lower()
+        if format_type == 'json':
             export_data = {'metadata': metadata, 'data': data}
-            if not filename:
-                filename = generate_filename('ranch_results', 'json')
-            else:
-                filename = sanitize_filename(filename)
-                if not filename.endswith('.json'):
-                    filename += '.json'
+            filename = _export_filename(filename, 'json')
             try:
-                with open(filename, 'w', encoding='utf-8') as jsonfile:
-                    json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+                _write_json(export_data, filename)
                 print(f'Results exported to {filename}')
                 return filename
             except Exception as e:
                 print(f'Error exporting to JSON: {e}')
                 return ''
-        else:
-            data_file = self.export_data(data, format_type, filename)
-            if data_file:
-                metadata_filename = data_file.replace('.csv', '_metadata.json')
+        elif format_type == 'csv':
+            filename = _export_filename(filename, 'csv')
+            metadata_filename = filename.replace('.csv', '_metadata.json')
+            # The sidecar does not depend on the data file's contents, so both are written at once
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                data_future = pool.submit(self.export_to_csv, data, filename)
+                metadata_future = pool.submit(_write_json, metadata, metadata_filename)
+                data_file = data_future.result()
+                metadata_error = metadata_future.exception()
+            if not data_file:
+                # no sidecar without its data file
                 try:
-                    with open(metadata_filename, 'w', encoding='utf-8') as metafile:
-                        json.dump(metadata, metafile, indent=2, ensure_ascii=False)
-                    print(f'Metadata exported to {metadata_filename}')
-                except Exception as e:
-                    print(f'Error exporting metadata: {e}')
+                    os.remove(metadata_filename)
+                except OSError:
+                    pass
+            elif metadata_error is not None:
+                print(f'Error exporting metadata: {metadata_error}')
+            else:
+                print(f'Metadata exported to {metadata_filename}')
             return data_file
+        else:
+            return self.export_data(data, format_type, filename)
@@ -1,18 +1,27 @@
-from typing import Dict, Optional
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
 from playwright.async_api import Page
 from .form_parser import FormParser
 from .utils import normalize_string
 
+logger = logging.getLogger(__name__)
+
 class FormHandler:
+    # (parameter, field id, is dropdown) for every field the search form has
+    _FIELDS = (('name', 'ranch_search_val', False), ('city', 'ranch_search_city', False), ('member_id', 'ranch_search_id', False), ('prefix', 'ranch_search_prefix', False), ('location', 'search-member-location', True))
 
-    def __init__(self):
-        self.form_parser = FormParser()
-        self.field_mappings = {'name': 'ranch_search_val', 'city': 'ranch_search_city', 'member_id': 'ranch_search_id', 'prefix': 'ranch_search_prefix', 'location': 'search-member-location'}
+    def __init__(self, form_parser: Optional[FormParser]=None):
+        # Sharing the caller's parser also shares its per-page dropdown cache
+        self.form_parser = form_parser or FormParser()
+        self.field_mappings = {name: field_id for name, field_id, _ in self._FIELDS}
+        # Keyed by page URL so a different search page never reuses another's answers
+        self._location_cache: Dict[Tuple[str, str], str] = {}
 
     async def validate_form_structure(self, page: Page) -> bool:
         is_valid, missing_fields = await self.form_parser.validate_required_fields(page)
         if not is_valid:
-            print(f'Missing required fields: {missing_fields}')
+            logger.error('Missing required fields: %s', missing_fields)
             return False
         return True
 
@@ -20,44 +29,57 @@ class FormHandler:
         try:
             element = await page.wait_for_selector(f'#{field_id}', timeout=5000)
             await element.fill(value.upper())
-            print(f'Filled {field_id}: {value}')
+            logger.info('Filled %s: %s', field_id, value)
             return True
         except Exception as e:
-            print(f'Error filling {field_id}: {e}')
+            logger.error('Error filling %s: %s', field_id, e)
             return False
 
-    async def fill_dropdown_field(self, page: Page, field_id: str, value: str) -> bool:
+    async def fill_dropdown_field(self, page: Page, field_id: str, value: str, required: bool=True) -> bool:
         try:
             element = await page.wait_for_selector(f'#{field_id}', timeout=5000)
-            mapped_value = await self.form_parser.map_location_input(page, value)
+            key = (page.url, value.strip().upper())
+            mapped_value = self._location_cache.get(key)
+            if mapped_value is None:
+                # the option list is read from the page once and matched locally from then on
+                options = await self.list_available_options(page, field_id)
+                mapped_value = self.form_parser.match_location(options, value)
+                # misses are not cached: an empty option list may only mean the dropdown had not loaded
+                if mapped_value:
+                    self._location_cache[key] = mapped_value
             if mapped_value:
                 await element.select_option(value=mapped_value)
-                print(f'Selected {field_id}: {value} -> {mapped_value}')
+                logger.info('Selected %s: %s -> %s', field_id, value, mapped_value)
                 return True
             else:
-                print(f"Warning: Could not map '{value}' for {field_id}")
-                return False
+                logger.warning("Could not map '%s' for %s", value, field_id)
+                # an optional filter that matches nothing is left unset rather than failing the form
+                return not required
         except Exception as e:
-            print(f'Error filling dropdown {field_id}: {e}')
+            logger.error('Error filling dropdown %s: %s', field_id, e)
             return False
 
-    async def fill_form_fields(self, page: Page, params: Dict[str, str]) -> bool:
+    async def fill_form_fields(self, page: Page, params: Dict[str, str], require_dropdown_match: bool=True) -> bool:
         success = True
-        for param_name, value in params.items():
+        names = []
+        fills = []
+        for param_name, field_id, is_dropdown in self._FIELDS:
+            value = params.get(param_name)
             if not value:
                 continue
-            field_id = self.field_mappings.get(param_name)
-            if not field_id:
-                print(f'Unknown parameter: {param_name}')
-                continue
-            try:
-                if param_name == 'location':
-                    if not await self.fill_dropdown_field(page, field_id, value):
-                        success = False
-                elif not await self.fill_text_field(page, field_id, value):
-                    success = False
-            except Exception as e:
-                print(f'Error processing {param_name}: {e}')
+            names.append(param_name)
+            fills.append(self.fill_dropdown_field(page, field_id, value, require_dropdown_match) if is_dropdown else self.fill_text_field(page, field_id, value))
+        if len(names) < len(params):
+            for param_name, value in params.items():
+                if value and param_name not in self.field_mappings:
+                    logger.warning('Unknown parameter: %s', param_name)
+        # Each field is a separate element, so the browser round trips can overlap
+        results = await asyncio.gather(*fills, return_exceptions=True)
+        for param_name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error('Error processing %s: %s', param_name, result)
+                success = False
+            elif not result:
                 success = False
         return success
 
@@ -65,6 +87,7 @@ class FormHandler:
         return await self.form_parser.get_form_structure(page)
 
     async def list_available_options(self, page: Page, field_id: str) -> list:
+        # FormParser keeps the option list per page, so this only reads the page once
         return await self.form_parser.get_dropdown_options(page, field_id)
 
     def normalize_input(self, text: str) -> str:
@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from playwright.async_api import Page
 import re
 
@@ -6,10 +6,42 @@ class FormParser:
 
     def __init__(self):
         self.field_mappings = {'ranch_search_val': 'name', 'ranch_search_city': 'city', 'ranch_search_id': 'member_id', 'ranch_search_prefix': 'prefix', 'search-member-location': 'location'}
+        # Option lists per (page, select id); a page's entries are dropped when it navigates or closes
+        self._dropdown_cache: Dict[Tuple[int, str], List[Dict[str, str]]] = {}
+        self._watched_pages: Set[int] = set()
+
+    def _watch_page(self, page: Page) -> None:
+        page_id = id(page)
+        if page_id in self._watched_pages:
+            return
+        self._watched_pages.add(page_id)
+
+        def forget(*_):
+            for key in [key for key in self._dropdown_cache if key[0] == page_id]:
+                del self._dropdown_cache[key]
+
+        def on_navigated(frame) -> None:
+            if frame is page.main_frame:
+                forget()
+
+        def on_close(*_) -> None:
+            forget()
+            self._watched_pages.discard(page_id)
+        page.on('framenavigated', on_navigated)
+        page.on('close', on_close)
 
     async def get_dropdown_options(self, page: Page, select_id: str) -> List[Dict[str, str]]:
+        key = (id(page), select_id)
+        cached = self._dropdown_cache.get(key)
+        if cached is not None:
+            return list(cached)
         try:
             options = await page.evaluate(f"\n                () => {{\n                    const select = document.querySelector('#{select_id}');\n                    if (!select) return [];\n                    \n                    const options = Array.from(select.options);\n                    return options.map(option => ({{\n                        value: option.value,\n                        text: option.text.trim()\n                    }})).filter(option => option.value && option.value.trim() !== '|');\n                }}\n            ")
+            # an empty list may only mean the dropdown has not been populated yet, so it is not kept
+            if options:
+                self._watch_page(page)
+                self._dropdown_cache[key] = options
+                return list(options)
             return options
         except Exception as e:
             print(f'Error extracting dropdown options for {select_id}: {e}')
@@ -45,6 +77,9 @@ class FormParser:
 
     async def map_location_input(self, page: Page, user_input: str) -> Optional[str]:
         options = await self.get_dropdown_options(page, 'search-member-location')
+        return self.match_location(options, user_input)
+
+    def match_location(self, options: List[Dict[str, str]], user_input: str) -> Optional[str]:
         if not options:
             return None
         user_input = user_input.strip().upper()
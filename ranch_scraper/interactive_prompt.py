@@ -13,10 +13,13 @@ class InteractivePrompt:
     async def get_available_dropdown_options(self, page: Page, field_id: str) -> List[Dict[str, str]]:
         return await self.form_parser.get_dropdown_options(page, field_id)
 
-    async def validate_location_input(self, page: Page, user_input: str) -> Tuple[bool, Optional[str]]:
+    async def validate_location_input(self, page: Page, user_input: str, options: Optional[List[Dict[str, str]]]=None) -> Tuple[bool, Optional[str]]:
         if not user_input.strip():
             return (True, None)
-        mapped_value = await self.form_parser.map_location_input(page, user_input)
+        if options is not None:
+            mapped_value = self.form_parser.match_location(options, user_input)
+        else:
+            mapped_value = await self.form_parser.map_location_input(page, user_input)
         if mapped_value:
             return (True, mapped_value)
         else:
@@ -50,7 +53,7 @@ class InteractivePrompt:
                     else:
                         return None
             except ValueError:
-                is_valid, mapped_value = await self.validate_location_input(page, user_input)
+                is_valid, mapped_value = await self.validate_location_input(page, user_input, options)
                 if not is_valid:
                     print(f"⚠️  Warning: '{user_input}' not found in available locations")
                     retry = input('Try again? (y/n): ').strip().lower()
@@ -1,27 +1,37 @@
 import asyncio
 import re
 from typing import List, Dict, Any, Optional, Tuple
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeoutError
+from .browser import BrowserManager, block_resources
+from .form_handler import FormHandler
 from .form_parser import FormParser
 from .utils import normalize_string, clean_table_data, format_table_output, parse_profile_table
 
+_RESULTS_LOADED_SCRIPT = """
+    () => {
+        const container = document.querySelector('#dvSearchResults');
+        return !!container && container.textContent.includes('Profiles Match');
+    }
+"""
+
 class DynamicScraper:
 
     def __init__(self, base_url: str='https://shorthorn.digitalbeef.com'):
         self.base_url = base_url
         self.form_parser = FormParser()
+        self.form_handler = FormHandler(self.form_parser)
         self.browser = None
         self.playwright = None
+        self._page: Optional[Page] = None
 
     async def init_browser(self) -> Tuple[Browser, any]:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True)
-        return (browser, playwright)
+        return await BrowserManager.get()
 
     async def navigate_to_site(self, page: Page) -> bool:
         try:
             print(f'Navigating to {self.base_url}')
-            await page.goto(self.base_url, wait_until='networkidle')
+            # callers follow up with wait_for_form_ready, which waits for the section actually used
+            await page.goto(self.base_url, wait_until='domcontentloaded')
             return True
         except Exception as e:
             print(f'Error navigating to site: {e}')
@@ -44,31 +54,8 @@ class DynamicScraper:
 
     async def fill_search_form(self, page: Page, search_params: Dict[str, str]) -> bool:
         try:
-            form_structure = await self.form_parser.get_form_structure(page)
-            for field_name, value in search_params.items():
-                if not value:
-                    continue
-                field_mappings = {'name': 'ranch_search_val', 'city': 'ranch_search_city', 'member_id': 'ranch_search_id', 'prefix': 'ranch_search_prefix', 'location': 'search-member-location'}
-                field_id = field_mappings.get(field_name)
-                if not field_id:
-                    print(f'Unknown field: {field_name}')
-                    continue
-                try:
-                    element = await page.wait_for_selector(f'#{field_id}', timeout=5000)
-                    if field_name == 'location':
-                        mapped_value = await self.form_parser.map_location_input(page, value)
-                        if mapped_value:
-                            await element.select_option(value=mapped_value)
-                            print(f'Selected location: {value} -> {mapped_value}')
-                        else:
-                            print(f"Warning: Could not map location '{value}'")
-                    else:
-                        await element.fill(value.upper())
-                        print(f'Filled {field_name}: {value}')
-                except Exception as e:
-                    print(f'Error filling {field_name}: {e}')
-                    return False
-            return True
+            # a location that matches no option only drops that filter, as it always has
+            return await self.form_handler.fill_form_fields(page, search_params, require_dropdown_match=False)
         except Exception as e:
             print(f'Error filling search form: {e}')
             return False
@@ -97,7 +84,11 @@ class DynamicScraper:
     async def wait_for_results(self, page: Page) -> bool:
         try:
             await page.wait_for_selector('#dvSearchResults', timeout=10000)
-            await page.wait_for_timeout(3000)
+            try:
+                # Settle time is capped at the old fixed 3s but ends as soon as the results header renders
+                await page.wait_for_function(_RESULTS_LOADED_SCRIPT, timeout=3000, polling=250)
+            except PlaywrightTimeoutError:
+                pass
             content = await page.inner_text('#dvSearchResults')
             if content.strip():
                 print('Search results loaded')
@@ -121,8 +112,13 @@ class DynamicScraper:
 
     async def scrape_ranches(self, search_params: Dict[str, str]) -> List[Dict[str, str]]:
         try:
-            self.browser, self.playwright = await self.init_browser()
-            page = await self.browser.new_page()
+            page = self._page
+            if page is None or page.is_closed():
+                self.browser, self.playwright = await self.init_browser()
+                page = await self.browser.new_page()
+                await block_resources(page)
+                self._page = page
+            # Navigating again resets the form and results, so back-to-back searches share one page
             if not await self.navigate_to_site(page):
                 return []
             if not await self.wait_for_form_ready(page):
@@ -141,27 +137,27 @@ class DynamicScraper:
             return results
         except Exception as e:
             print(f'Error during scraping: {e}')
+            self._page = None
             return []
-        finally:
-            if self.browser:
-                try:
-                    await self.browser.close()
-                except Exception as e:
-                    print(f'Warning: Error closing browser: {e}')
-            if self.playwright:
-                try:
-                    await self.playwright.stop()
-                except Exception as e:
-                    print(f'Warning: Error stopping playwright: {e}')
+
+    async def close(self) -> None:
+        # The browser is shared through BrowserManager; only release this scraper's page
+        page, self._page = (self._page, None)
+        if page is not None and not page.is_closed():
+            try:
+                await page.close()
+            except Exception as e:
+                print(f'Warning: Error closing page: {e}')
+        self.browser = None
+        self.playwright = None
 
     async def get_form_info(self, page: Page) -> Dict[str, Any]:
         try:
             if page.url != self.base_url:
                 await self.navigate_to_site(page)
                 await self.wait_for_form_ready(page)
-            form_structure = await self.form_parser.get_form_structure(page)
-            locations = await self.get_available_locations(page)
-            button_info = await self.form_parser.get_search_button_info(page)
+            # independent read-only evaluations on the loaded form
+            form_structure, locations, button_info = await asyncio.gather(self.form_parser.get_form_structure(page), self.get_available_locations(page), self.form_parser.get_search_button_info(page))
             return {'form_structure': form_structure, 'available_locations': locations, 'search_button': button_info, 'base_url': self.base_url}
         except Exception as e:
             print(f'Error getting form info: {e}')
@@ -207,7 +203,7 @@ class DynamicScraper:
                 continue
             try:
                 print(f'  Navigating to: {profile_url}')
-                await page.goto(profile_url, wait_until='networkidle', timeout=15000)
+                await page.goto(profile_url, wait_until='domcontentloaded', timeout=15000)
                 profile_details = await parse_profile_table(page)
                 print(f'  Extracted profile details: {profile_details}')
                 enriched_ranch = ranch.copy()
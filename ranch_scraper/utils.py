@@ -1,4 +1,10 @@
+import asyncio
+import json
+import os
 import re
+import sys
+import threading
+import time
 from typing import List, Dict, Any, Optional, Tuple
 
 def normalize_string(text: str) -> str:
@@ -115,6 +121,27 @@ def sanitize_filename(filename: str) -> str:
         filename = 'ranch_results'
     return filename
 
+def read_json_cache(path: str, ttl: float, **expected: Any) -> Optional[Any]:
+    # None on any miss: no readable entry, an expired one, or one whose metadata differs from expected
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if any((entry.get(key) != value for key, value in expected.items())):
+            return None
+        if time.time() - entry['timestamp'] >= ttl:
+            return None
+        return entry['data']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+def write_json_cache(path: str, data: Any, **meta: Any) -> None:
+    # Renamed into place so a concurrent reader never sees half an entry; callers decide how to report failures
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({**meta, 'timestamp': time.time(), 'data': data}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
 async def parse_profile_table(page) -> Dict[str, str]:
     try:
         await page.wait_for_selector('#ajax_profile_details table', timeout=10000)
@@ -124,3 +151,53 @@ async def parse_profile_table(page) -> Dict[str, str]:
     except Exception as e:
         print(f'Error parsing profile table: {e}')
         return {'breeder_type': '', 'profile_type': '', 'profile_id': '', 'profile_name': '', 'dba': '', 'herd_prefix': ''}
+
+def uncancel_current_task() -> None:
+    # Under asyncio.run, Ctrl+C arrives as a cancel of the main task rather than a KeyboardInterrupt;
+    # a prompt that handles it withdraws the request so the task carries on as uncancelled
+    task = asyncio.current_task()
+    if task is not None and hasattr(task, 'uncancel'):
+        task.uncancel()
+
+# A read whose prompt was cancelled (Ctrl+C) while its thread still waits on stdin
+_pending_read: Optional[asyncio.Future] = None
+
+async def ainput(prompt: str) -> str:
+    # input() runs on a daemon thread so the loop keeps servicing Playwright while the user types;
+    # asyncio.to_thread would leave a non-daemon worker blocked in input() and hang shutdown on Ctrl+C
+    global _pending_read
+    loop = asyncio.get_running_loop()
+    future = _pending_read
+    if future is not None and future.get_loop() is loop:
+        # a second reader would race the stranded one for the next line, so take over its read instead
+        if not future.done():
+            print(prompt, end='', flush=True)
+    else:
+        future = loop.create_future()
+
+        def settle(value, error):
+            if future.done():
+                return
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
+
+        def read():
+            # Holding stdin here keeps it from being closed at interpreter shutdown; on a pipe that close
+            # would need the lock input() is blocked holding, and CPython aborts instead of waiting
+            stdin = sys.stdin
+            try:
+                line = input(prompt)
+            except BaseException as e:
+                loop.call_soon_threadsafe(settle, None, e)
+            else:
+                loop.call_soon_threadsafe(settle, line, None)
+        threading.Thread(target=read, daemon=True).start()
+    _pending_read = future
+    try:
+        # shielded so a cancelled prompt leaves the read running for the next one
+        return await asyncio.shield(future)
+    finally:
+        if future.done():
+            _pending_read = None
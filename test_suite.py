@@ -1,5 +1,7 @@
 import asyncio
+import builtins
 import sys
+import threading
 from typing import Dict, List, Tuple
 
 # Ensure modules are importable when run from repo root
@@ -7,6 +9,8 @@ from ranch_scraper.scraper import DynamicScraper
 from ranch_scraper.form_parser import FormParser
 from animal_scraper.scraper import AnimalSearchScraper
 from epd_scraper.scraper import EPDSearchScraper
+from ranch_scraper.browser import BrowserManager, PagePool
+from ranch_scraper.utils import ainput
 
 PASS = 'PASS'
 FAIL = 'FAIL'
@@ -71,8 +75,8 @@ async def test_ranch_location_mapping() -> TestResult:
     try:
         scraper = DynamicScraper()
         browser, playwright = await scraper.init_browser()
+        page = await browser.new_page()
         try:
-            page = await browser.new_page()
             await scraper.navigate_to_site(page)
             await scraper.wait_for_form_ready(page)
             options = await scraper.get_available_locations(page)
@@ -89,12 +93,9 @@ async def test_ranch_location_mapping() -> TestResult:
                 t.ok(f"Mapped 'Texas' -> {mapped_tx_name} , 'TX' -> {mapped_tx_code}")
             return t
         finally:
+            # the browser is shared; run_all_tests shuts it down
             try:
-                await browser.close()
-            except Exception:
-                pass
-            try:
-                await playwright.stop()
+                await page.close()
             except Exception:
                 pass
     except Exception as e:
@@ -184,7 +185,8 @@ async def test_animal_detail_extraction() -> TestResult:
 async def test_epd_basic_search() -> TestResult:
     t = TestResult('EPD: search returns rows with broad settings')
     try:
-        scraper = EPDSearchScraper()
+        # No results cache: the test must hit the live site
+        scraper = EPDSearchScraper(cache_dir=None)
         # Try several broad parameter sets to obtain some rows
         candidates = [
             {'sort_field': 'epd_ww', 'search_sex': ''},
@@ -192,27 +194,94 @@ async def test_epd_basic_search() -> TestResult:
             {'weaning_weight_min': '0', 'sort_field': 'epd_ww', 'search_sex': ''},
             {'milk_min': '0', 'sort_field': 'epd_ww', 'search_sex': ''},
         ]
-        for params in candidates:
-            results = await scraper.scrape_epd(params)
-            if isinstance(results, list) and len(results) > 0:
-                t.ok(f"Params {params} -> {len(results)} rows")
-                sample = results[0]
-                basic_keys = {'registration', 'name'}
-                missing = [k for k in basic_keys if k not in sample]
-                if missing:
-                    t.error(f"Missing expected keys in first row: {missing}")
-                else:
-                    t.ok('First row contains expected keys')
-                return t
-        t.error('All tried EPD parameter sets returned 0 rows')
-        return t
+        try:
+            for params in candidates:
+                results = await scraper.scrape_epd(params)
+                if isinstance(results, list) and len(results) > 0:
+                    t.ok(f"Params {params} -> {len(results)} rows")
+                    sample = results[0]
+                    basic_keys = {'registration', 'name'}
+                    missing = [k for k in basic_keys if k not in sample]
+                    if missing:
+                        t.error(f"Missing expected keys in first row: {missing}")
+                    else:
+                        t.ok('First row contains expected keys')
+                    return t
+            t.error('All tried EPD parameter sets returned 0 rows')
+            return t
+        finally:
+            await scraper.close()
     except Exception as e:
         t.error(f'Exception: {e}')
         return t
 
 
+async def test_ainput_cancel() -> TestResult:
+    t = TestResult('Utils: cancelled ainput hands its pending line to the next prompt')
+    typed = threading.Event()
+    reads: List[str] = []
+
+    def fake_input(prompt: str = '') -> str:
+        reads.append(prompt)
+        typed.wait(5)
+        return 'typed'
+
+    original_input = builtins.input
+    builtins.input = fake_input
+    try:
+        # Ctrl+C under asyncio.run cancels the task awaiting the prompt
+        pending = asyncio.ensure_future(ainput('first: '))
+        await asyncio.sleep(0.05)
+        pending.cancel()
+        try:
+            await pending
+            t.error('Cancelled prompt returned instead of raising CancelledError')
+        except asyncio.CancelledError:
+            t.ok('Pending prompt raised CancelledError')
+        typed.set()
+        line = await asyncio.wait_for(ainput('second: '), timeout=5)
+        if line == 'typed':
+            t.ok('Next prompt received the line typed after the cancel')
+        else:
+            t.error(f'Next prompt returned {line!r}')
+        if len(reads) == 1:
+            t.ok('Only one thread read from stdin')
+        else:
+            t.error(f'Expected one stdin read, got {len(reads)}')
+    except Exception as e:
+        t.error(f'Exception: {e}')
+    finally:
+        builtins.input = original_input
+    return t
+
+
+async def test_page_pool_failed_open() -> TestResult:
+    t = TestResult('PagePool: failed page opens do not strand waiting callers')
+
+    class FailingBrowser:
+        async def new_page(self):
+            await asyncio.sleep(0.01)
+            raise RuntimeError('new_page failed')
+
+    pool = PagePool(FailingBrowser(), max_size=2)
+    try:
+        # more callers than slots, so some wait for a slot while the first opens fail
+        outcomes = await asyncio.wait_for(asyncio.gather(*(pool.acquire() for _ in range(5)), return_exceptions=True), timeout=5)
+        if all((isinstance(outcome, RuntimeError) for outcome in outcomes)):
+            t.ok('Every caller got the open error')
+        else:
+            t.error(f'Unexpected outcomes: {outcomes}')
+    except asyncio.TimeoutError:
+        t.error('acquire() hung after the page opens failed')
+    except Exception as e:
+        t.error(f'Exception: {e}')
+    return t
+
+
 async def run_all_tests() -> Tuple[List[TestResult], int]:
     tests = [
+        test_ainput_cancel,
+        test_page_pool_failed_open,
         test_ranch_simple_search,
         test_ranch_location_mapping,
         test_animal_search_by_name,
@@ -221,11 +290,14 @@ async def run_all_tests() -> Tuple[List[TestResult], int]:
     ]
     results: List[TestResult] = []
     failures = 0
-    for test in tests:
-        res = await test()
-        results.append(res)
-        if res.status == FAIL:
-            failures += 1
+    try:
+        for test in tests:
+            res = await test()
+            results.append(res)
+            if res.status == FAIL:
+                failures += 1
+    finally:
+        await BrowserManager.close()
     return results, failures
 
 